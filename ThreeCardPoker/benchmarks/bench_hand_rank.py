@@ -0,0 +1,56 @@
+"""Microbenchmark of the hand rank lookup table against the per-hand set logic it replaced.
+
+Run from the ThreeCardPoker directory:
+    python -m benchmarks.bench_hand_rank
+"""
+from itertools import combinations
+from timeit import timeit
+
+from model.deck import Deck
+from model.player import User, HandType
+
+def legacy_evaluate_hand(hand):
+    """Per-hand set logic formerly in Player.evaluate_hand, kept here as the baseline."""
+    values = set([card.card_value for card in hand])
+    suits = set([card.card_suit for card in hand])
+    sorted_hand = sorted(hand)
+    lowest_card_val = sorted_hand[0].card_value - 1
+    straight = [x.card_value - lowest_card_val for x in sorted_hand] == [1, 2, 3]
+    highest_card = max(hand)
+
+    if straight and len(suits) == 1:
+        return HandType.STRAIGHT_FLUSH, highest_card
+    elif len(values) == 1:
+        return HandType.THREE_OF_A_KIND, highest_card
+    elif straight:
+        return HandType.STRAIGIHT, highest_card
+    elif len(suits) == 1:
+        return HandType.FLUSH, highest_card
+    elif len(values) == 2:
+        return HandType.PAIR, highest_card
+    else:
+        return HandType.HIGH_CARD, highest_card
+
+def main(repeat=5):
+    """Times both evaluators over all 22,100 hands and prints the speedup."""
+    hands = list(combinations(Deck().cards, 3))
+    user = User()
+
+    def legacy():
+        for hand in hands:
+            legacy_evaluate_hand(hand)
+
+    def table():
+        for hand in hands:
+            user.hand = hand
+            user.evaluate_hand()
+
+    legacy_time = min(timeit(legacy, number=1) for _ in range(repeat))
+    table_time = min(timeit(table, number=1) for _ in range(repeat))
+    print(f'{len(hands)} hands')
+    print(f'set logic:    {legacy_time * 1e9 / len(hands):8.1f} ns/hand')
+    print(f'lookup table: {table_time * 1e9 / len(hands):8.1f} ns/hand')
+    print(f'speedup:      {legacy_time / table_time:8.1f}x')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Soak run of the Controller state machine with a scripted headless view, checking that money
+is conserved every round, then reporting the rounds per second.
+
+Run from the ThreeCardPoker directory:
+    python -m benchmarks.bench_soak --rounds 100000
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+
+from controller.controller import Controller
+from model.model import Model
+from view.headless import AutoPlayer, ScriptedView
+
+class CheckedPlayer(AutoPlayer):
+    """AutoPlayer that checks every settled round against the money the user started it with."""
+    def __call__(self, view) -> tuple:
+        """Checks the round at the stage the view is showing, then plays on."""
+        model = view.model
+        if view.curr_display == 'prebet':
+            self.start = model.user.money + model.ante
+        elif view.curr_display == 'postbet':
+            assert model.user.money == self.start + model.net, 'money not conserved'
+            assert len(set(model.user.hand + model.dealer.hand)) == 6, 'card dealt twice'
+        return super().__call__(view)
+
+def main(argv=None):
+    """Parses the command line, plays the rounds and prints the report."""
+    parser = ArgumentParser(prog='python -m benchmarks.bench_soak', description='Soak the controller with a headless view.')
+    parser.add_argument('--rounds', type=int, default=100_000, help='rounds to play')
+    parser.add_argument('--pair-plus', type=int, default=1000, help='pair plus bet each round, in cents')
+    args = parser.parse_args(argv)
+
+    model = Model()
+    player = CheckedPlayer(args.rounds, pair_plus=args.pair_plus)
+    view = ScriptedView(player, model=model)
+    controller = Controller(model=model, view=view)
+    start = perf_counter()
+    controller.go()
+    elapsed = perf_counter() - start
+
+    print(f'Rounds:            {player.played}')
+    print(f'Game overs:        {view.displays["gameover"]}')
+    print(f'Rounds per second: {player.played / elapsed:,.0f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Cold-start benchmark of main.py: the import time of every module it loads, from
+python -X importtime, and the wall time from launching the interpreter to the first window.
+
+Each measurement runs in a fresh interpreter. The first window is the menu, built the way
+main.py builds it; without PySimpleGUI, the headless NullView stands in and the report says so.
+
+Run from the ThreeCardPoker directory:
+    python -m benchmarks.bench_startup --target-ms 300
+"""
+import subprocess
+import sys
+from argparse import ArgumentParser
+from time import perf_counter
+
+# Wall time from launch to first window that a kiosk restart should stay within
+TARGET_MS = 300
+
+IMPORTS = 'import profiling, history; from model.model import Model; from controller.controller import Controller'
+
+FIRST_WINDOW = IMPORTS + '''
+try:
+    import PySimpleGUI
+    view = None
+except ImportError:
+    from view.headless import NullView
+    view = NullView()
+controller = Controller(model=Model(), view=view)
+controller.enter('menu')
+if view is None:
+    controller.view.refresh()
+print('gui' if view is None else 'headless', flush=True)
+controller.view.close()
+'''
+
+def import_times(code=IMPORTS) -> list:
+    """Runs code under python -X importtime.
+    Returns:
+        list: (cumulative microseconds, self microseconds, module) of every import, slowest first.
+    """
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True).stderr
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, module = line[len('import time:'):].split('|')
+        times.append((int(cumulative), int(own), module.strip()))
+    return sorted(times, reverse=True)
+
+def first_window(repeat=5) -> tuple:
+    """Launches the game up to its first window 'repeat' times.
+    Returns:
+        tuple: (best milliseconds, median milliseconds, 'gui' or 'headless').
+    """
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        backend = subprocess.run([sys.executable, '-c', FIRST_WINDOW], capture_output=True, text=True, check=True).stdout.strip()
+        times.append((perf_counter() - start) * 1e3)
+    times.sort()
+    return times[0], times[len(times) // 2], backend
+
+def main(argv=None):
+    """Parses the command line, measures the cold start and reports it against the target."""
+    parser = ArgumentParser(prog='python -m benchmarks.bench_startup', description='Measure the cold start of main.py.')
+    parser.add_argument('--target-ms', type=float, default=TARGET_MS, help='time to first window to stay within')
+    parser.add_argument('--repeat', type=int, default=5, help='launches timed')
+    parser.add_argument('--top', type=int, default=10, help='slowest imports listed')
+    args = parser.parse_args(argv)
+
+    # Modules the bare interpreter imports anyway are left out
+    times = import_times()
+    baseline = {module for _, _, module in import_times('pass')}
+    own = [entry for entry in times if entry[2] not in baseline]
+    print(f'Imports beyond the interpreter: {sum(t[1] for t in own) / 1e3:.1f} ms over {len(own)} modules')
+    for cumulative, self_time, module in sorted(own, key=lambda entry: entry[1], reverse=True)[:args.top]:
+        print(f'  {self_time / 1e3:7.1f} ms self {cumulative / 1e3:7.1f} ms cumulative  {module}')
+
+    best, median, backend = first_window(args.repeat)
+    verdict = 'within' if median <= args.target_ms else 'OVER'
+    print(f'First window ({backend}): {median:.0f} ms median, {best:.0f} ms best, {verdict} the {args.target_ms:.0f} ms target')
+
+if __name__ == '__main__':
+    main()
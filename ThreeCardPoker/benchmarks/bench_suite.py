@@ -0,0 +1,215 @@
+"""Benchmark suite of the game's hot paths, with a correctness oracle run first.
+
+Each benchmark reports the best of several timeit repeats in nanoseconds per operation. Results
+are written as JSON, and a previous results file can be given to print the change since then.
+
+Run from the ThreeCardPoker directory:
+    python -m benchmarks.bench_suite --output new.json --compare old.json
+"""
+import json
+import platform
+import random
+import subprocess
+import sys
+from argparse import ArgumentParser
+from collections import Counter
+from itertools import combinations, groupby
+from timeit import Timer
+
+from model.card import Card
+from model.deck import Deck
+from model.hand_rank import HandType, HAND_RANKS, HAND_TYPES, HAND_TYPE_SHIFT
+from model.model import Model
+from sim.strategies import Q64_RANK
+
+def brute_force_key(hand) -> tuple:
+    """Ranks a hand from first principles, independently of the lookup table: a HandType and the
+    card values that break ties between hands of that type.
+    Args:
+        hand (tuple): three cards.
+    Returns:
+        tuple: (HandType, tie breaking values), where a larger key is a better hand.
+    """
+    values = sorted((card.card_value for card in hand), reverse=True)
+    flush = len({card.card_suit for card in hand}) == 1
+    if values == [14, 3, 2]:
+        values = [3, 2, 1]
+    straight = values[0] - values[1] == 1 and values[1] - values[2] == 1
+    counts = Counter(values)
+    if straight and flush:
+        hand_type = HandType.STRAIGHT_FLUSH
+    elif len(counts) == 1:
+        hand_type = HandType.THREE_OF_A_KIND
+    elif straight:
+        hand_type = HandType.STRAIGIHT
+    elif flush:
+        hand_type = HandType.FLUSH
+    elif len(counts) == 2:
+        hand_type = HandType.PAIR
+        values = sorted(values, key=lambda value: (counts[value], value), reverse=True)
+    else:
+        hand_type = HandType.HIGH_CARD
+    return hand_type.value, tuple(values)
+
+def check_hand_ranks() -> dict:
+    """Cross-checks the lookup table and Player.evaluate_hand against brute_force_key for all
+    22,100 hands: every hand must get the same HandType, and ranks must order the hands exactly
+    as the brute force keys do, equal keys tying.
+    Raises:
+        AssertionError: on the first disagreement.
+    Returns:
+        dict: number of hands of each HandType.
+    """
+    user = Model().user
+    keyed = []
+    for hand in combinations(Card.ALL, 3):
+        user.hand = hand
+        hand_type, rank = user.evaluate_hand()
+        key = brute_force_key(hand)
+        assert HAND_RANKS[hand[0].mask | hand[1].mask | hand[2].mask] == rank, hand
+        assert hand_type.value == key[0] == rank >> HAND_TYPE_SHIFT, hand
+        keyed.append((key, rank))
+
+    keyed.sort()
+    previous = -1
+    for key, group in groupby(keyed, key=lambda item: item[0]):
+        ranks = {rank for _, rank in group}
+        assert len(ranks) == 1, f'hands with key {key} rank differently'
+        rank = ranks.pop()
+        assert rank > previous, f'hands with key {key} rank out of order'
+        previous = rank
+    return {HAND_TYPES[t].name: n for t, n in sorted(Counter(key[0] for key, _ in keyed).items())}
+
+def deals(n, seed=0) -> list:
+    """Deals 'n' rounds of six cards from a seeded deck."""
+    deck = Deck(rng=random.Random(seed))
+    rounds = []
+    for _ in range(n):
+        deck.reset()
+        rounds.append(deck.get_n_cards(6))
+    return rounds
+
+def bench_deck_cycle():
+    """Deals six cards and returns them to the deck."""
+    deck = Deck(rng=random.Random(0))
+    def run():
+        deck.return_used_cards(deck.get_n_cards(6))
+    return run, 1
+
+def bench_evaluate_hand():
+    """Evaluates all 22,100 hands, timed per hand."""
+    user = Model().user
+    hands = list(combinations(Card.ALL, 3))
+    def run():
+        for hand in hands:
+            user.hand = hand
+            user.evaluate_hand()
+    return run, len(hands)
+
+def bench_compare_hands():
+    """Compares dealt user and dealer hands, timed per comparison."""
+    model = Model()
+    rounds = [(cards[:3], cards[3:]) for cards in deals(1000)]
+    def run():
+        for model.user.hand, model.dealer.hand in rounds:
+            model.compare_hands()
+    return run, len(rounds)
+
+def bench_get_pair_plus():
+    """Pays the pair plus bet on dealt user hands, timed per payout."""
+    model = Model()
+    hands = [cards[:3] for cards in deals(1000)]
+    def run():
+        for model.user.hand in hands:
+            model.pair_plus = model.rules.min_bet
+            model.get_pair_plus()
+    return run, len(hands)
+
+def bench_full_round():
+    """Plays a headless round through Model: ante, pair plus, deal, play queen, six, four or
+    better or fold, compare and settle."""
+    model = Model()
+    model.deck.rng = random.Random(0)
+    rules = model.rules
+    def run():
+        if model.user.money < 2 * rules.ante + rules.min_bet:
+            model.user.money = model.user.INITIAL_MONEY
+        model.new_round()
+        model.place_ante()
+        model.place_pair_plus(rules.min_bet)
+        model.deal_hands()
+        if model.user.hand_rank() >= Q64_RANK:
+            model.place_play(rules.ante)
+            model.compare_hands()
+        else:
+            model.fold()
+        model.settle_round()
+    return run, 1
+
+BENCHMARKS = {
+    'deck_cycle': bench_deck_cycle,
+    'evaluate_hand': bench_evaluate_hand,
+    'compare_hands': bench_compare_hands,
+    'get_pair_plus': bench_get_pair_plus,
+    'full_round': bench_full_round,
+}
+
+def run_benchmark(setup, repeat=5, min_time=0.2) -> dict:
+    """Times a benchmark, calibrating the loop count so each repeat takes at least 'min_time'.
+    Args:
+        setup (function): returns the function to be timed and the operations one call performs.
+        repeat (int): number of timed repeats. Defaults to 5.
+        min_time (float): seconds each repeat should take. Defaults to 0.2.
+    Returns:
+        dict: best and median nanoseconds per operation over the repeats.
+    """
+    func, ops = setup()
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    times = sorted(t * 1e9 / (number * ops) for t in timer.repeat(repeat=repeat, number=number))
+    return {'best_ns': times[0], 'median_ns': times[len(times) // 2], 'ops': number * ops}
+
+def revision() -> str:
+    """Gets the git revision being benchmarked, None outside a git checkout."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None):
+    """Parses the command line, runs the oracle and the benchmarks and writes the results."""
+    parser = ArgumentParser(prog='python -m benchmarks.bench_suite', description='Benchmark the hot paths of the game.')
+    parser.add_argument('--output', default='bench_results.json', help='JSON results file to write')
+    parser.add_argument('--compare', help='JSON results file of a previous run to compare against')
+    parser.add_argument('--repeat', type=int, default=5, help='timed repeats of each benchmark')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help='benchmarks to run, defaults to all')
+    args = parser.parse_args(argv)
+
+    hand_types = check_hand_ranks()
+    print(f'oracle: {sum(hand_types.values())} hands agree ({", ".join(f"{name} {n}" for name, n in hand_types.items())})')
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as file:
+            previous = json.load(file)['benchmarks']
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        results[name] = run_benchmark(BENCHMARKS[name], repeat=args.repeat)
+        line = f'{name:<16}{results[name]["best_ns"]:10.1f} ns/op'
+        if name in previous:
+            line += f'  {results[name]["best_ns"] / previous[name]["best_ns"] - 1:+7.1%}'
+        print(line)
+
+    with open(args.output, 'w') as file:
+        json.dump({
+            'revision': revision(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'hand_types': hand_types,
+            'benchmarks': results,
+        }, file, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Cross-checks the NumPy batch path against Model on a shared corpus and times both paths.
+
+Run from the ThreeCardPoker directory:
+    python -m benchmarks.bench_vectorized
+"""
+from itertools import combinations
+
+import numpy as np
+
+from model.card import Card
+from model.model import Model
+from model.deck import Deck
+from sim.engine import simulate
+from sim.vectorized import play_q64_batch, rank_batch, settle_batch, simulate_batch
+
+def corpus(seed=0) -> np.ndarray:
+    """Pairs every one of the 22,100 user hands with a random dealer hand from the remaining cards.
+    Returns:
+        numpy.ndarray: (22100, 6) card codes.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for hand in combinations(range(Deck.SIZE), 3):
+        rest = np.setdiff1d(np.arange(Deck.SIZE), hand)
+        rows.append(hand + tuple(rng.choice(rest, 3, replace=False)))
+    return np.array(rows)
+
+def check(codes) -> tuple:
+    """Settles every corpus round with Model.compare_hands, Model.get_winnings and
+    Model.get_pair_plus and with the batch functions, folding below queen, six, four. Each result is
+    checked on its own, so errors in two of them cannot cancel out.
+    Returns:
+        tuple: numbers of rounds where the two disagree on the winner, on the net result of the
+        ante and play wager, and on the net result of the pair plus bet.
+    """
+    user_ranks = rank_batch(codes[:, :3])
+    dealer_ranks = rank_batch(codes[:, 3:])
+    play = play_q64_batch(codes[:, :3], user_ranks)
+    main_net, pair_plus_net = settle_batch(user_ranks, dealer_ranks, play)
+
+    model = Model()
+    ante = model.rules.ante
+    wins = (user_ranks > dealer_ranks).tolist()
+    winner_mismatches = main_mismatches = pair_plus_mismatches = 0
+    for row, played, won, main, pair_plus in zip(codes.tolist(), play.tolist(), wins, main_net.tolist(), pair_plus_net.tolist()):
+        model.user.set_hand(tuple(Card.from_code(code) for code in row[:3]))
+        model.dealer.set_hand(tuple(Card.from_code(code) for code in row[3:]))
+        model.ante = ante
+        model.pot = 2 * ante if played else ante
+        model.pair_plus = ante
+        model.folded = not played
+        winner_mismatches += model.compare_hands() != won
+        main_mismatches += model.get_winnings() - model.pot != main
+        pair_plus_mismatches += model.get_pair_plus() - ante != pair_plus
+    return winner_mismatches, main_mismatches, pair_plus_mismatches
+
+def main(rounds=2_000_000):
+    """Runs the cross-check, then times the scalar and batch simulations."""
+    codes = corpus()
+    winner, main_bets, pair_plus = check(codes)
+    print(f'corpus: {len(codes)} rounds, mismatches: {winner} winner, {main_bets} ante and play, {pair_plus} pair plus')
+    scalar = simulate(rounds // 10).rounds_per_second()
+    batch = simulate_batch(rounds, seed=0).rounds_per_second()
+    print(f'scalar: {scalar:12,.0f} rounds/s')
+    print(f'batch:  {batch:12,.0f} rounds/s')
+    print(f'speedup: {batch / scalar:11.1f}x')
+
+if __name__ == '__main__':
+    main()
@@ -1,120 +1,162 @@
+from model.deck import new_seed
 from model.model import Model
-from view.view import View
+from model.money import to_cents
 
 class Controller:
-    """Represents controller of the game."""
-    def __init__(self, model=Model()) -> None:
+    """Represents controller of the game as a state machine over the stages of a round:
+    menu -> prebet -> bet -> postbet -> prebet ..., with gameover once the user cannot cover the ante.
+    The controller only advances when handle_event() is given an event, so it can be driven by the
+    view or by scripted events."""
+    # Events that end the game from any state, None being a closed window
+    QUIT_EVENTS = (None, 'Quit')
+    # Event the view returns when a read times out with nothing to do
+    TIMEOUT_EVENT = '__TIMEOUT__'
+
+    def __init__(self, model=None, hint=False, view=None, history=None) -> None:
         """Constructs controller for the given model.
         Args:
-            model (_type_): model that is controlled
+            model (_type_): model that is controlled. Defaults to a new Model().
+            hint (bool): shows the best decision on the bet screen. Defaults to False.
+            view (BaseView): view that shows the game and produces events, such as a headless
+            view.headless.ScriptedView. Defaults to the graphical View(model).
+            history (HistoryWriter): hand history every settled round is appended to, each round
+            then being dealt from a recorded seed. Defaults to None.
         """
-        self.model = model
-        self.view = View(model=self.model)
-        self.ANTE = 25
-        
-    def start_round(self):
-        """Round start stage of the game. Updates model and view
-        Returns:
-            _type_: None or -1
+        self.model = Model() if model is None else model
+        self.hint = hint
+        self.history = history
+        if view is None:
+            from view.view import View
+            view = View(model=self.model, hint=hint)
+        self.view = view
+        self.state = 'menu'
+        self.handlers = {
+            'menu': self.on_menu,
+            'prebet': self.on_prebet,
+            'bet': self.on_bet,
+            'postbet': self.on_postbet,
+            'gameover': self.on_gameover,
+        }
+
+    def enter(self, state):
+        """Moves to a state and displays it.
+        Args:
+            state (str): state to be entered, also the view's display name.
         """
-        self.model.winner = None
-        self.model.round_over = False
-        self.model.game_over = False
-        self.model.pot = 0
-        self.model.pair_plus = 0
-        
-        self.model.deck.return_used_cards(self.model.user.discard_hand())
-        self.model.deck.return_used_cards(self.model.dealer.discard_hand())
-        self.view.curr_display = 'prebet'
-       
-        try:   
-            self.model.place_bet(self.ANTE)
+        self.state = state
+        self.view.curr_display = state
+        self.view.display()
+
+    def start_round(self):
+        """Round start stage of the game. Resets the round, places the ante and moves to the pair
+        plus bet, or to gameover if the user cannot cover the ante."""
+        self.model.new_round(seed=new_seed() if self.history is not None else None)
+
+        try:
+            self.model.place_ante()
         except ValueError:
             self.model.game_over = True
-            return -1
-        
-        self.view.display()
-        event, values = self.get_events_values()
-        
-        while event != 'Bet':
-            pass
-        
-        pair_plus = values['PreBet-Slider']
-        
-        while True:
-            try:
-                self.model.place_pair_plus(amount=pair_plus)
-                break
-            except ValueError:
-                pass
-        
+            self.gameover()
+            return
+
+        self.enter('prebet')
+
+    def play_round(self, pair_plus):
+        """Places the pair plus bet, deals and moves to the betting stage. An invalid bet leaves the
+        prebet stage up for another try, with the reason shown by the view.
+        Args:
+            pair_plus (int): pair plus bet in cents.
+        """
+        try:
+            self.model.place_pair_plus(amount=pair_plus)
+        except ValueError as error:
+            self.view.show_error(str(error))
+            return
+
         self.model.deal_hands()
-        
-    def play_round(self):
-        """Betting stage of game. Updates model and view.
-        Returns:
-            _type_: None or -1
+        self.enter('bet')
+
+    def end_round(self, play_wager=None):
+        """Evaluation stage of game. Places the play wager, or folds without one, settles the round
+        and moves to the post bet stage. An invalid bet leaves the bet stage up for another try, with
+        the reason shown by the view.
+        Args:
+            play_wager (int): play wager in cents, None to fold. Defaults to None.
         """
-        self.view.curr_display = 'bet'
-        self.view.display()
-        event = ''
-        while event != 'Bet':
-            if event == 'Fold':
-                return -1
-            
-            event, values = self.get_events_values()
-            
-        
-        while True:
-            event, values = self.get_events_values()
-            play_wager = values['Bet-Slider']
+        if play_wager is None:
+            self.model.fold()
+        else:
             try:
-                self.model.place_bet(amount=play_wager)
-                break
-            except ValueError:
-                pass
-        
-    def end_round(self):
-        """Evauation stage of game. Updates model and view."""
-        if self.model.compare_hands():
-            self.model.user.money += self.model.get_pot()
-        
-        self.model.round_over = True
-        self.view.curr_display = 'postbet'
-        self.view.display()
-        
-    def go(self):
-        """Runs the game in a sequential order.
+                self.model.place_play(amount=play_wager)
+            except ValueError as error:
+                self.view.show_error(str(error))
+                return
+            self.model.compare_hands()
+
+        self.model.settle_round()
+        if self.history is not None:
+            self.history.record(self.model)
+        self.enter('postbet')
+
+    def on_menu(self, event, values):
+        """Handles the events of the menu stage."""
+        if event == 'Start':
+            self.start_round()
+
+    def on_prebet(self, event, values):
+        """Handles the events of the pair plus stage."""
+        if event == 'Bet':
+            self.play_round(to_cents(values['PreBet-Slider']))
+
+    def on_bet(self, event, values):
+        """Handles the events of the betting stage."""
+        if event == 'Bet':
+            self.end_round(to_cents(values['Bet-Slider']))
+        elif event == 'Fold':
+            self.end_round()
+
+    def on_postbet(self, event, values):
+        """Handles the events of the post bet stage."""
+        if event == 'Next Round':
+            self.start_round()
+
+    def on_gameover(self, event, values):
+        """Handles the events of the gameover stage."""
+        if event == 'Play Again':
+            self.model.user.money = self.model.user.INITIAL_MONEY
+            self.start_round()
+
+    def handle_event(self, event, values):
+        """Advances the state machine by one event. Events the current state does not expect,
+        including read timeouts, are ignored.
+        Args:
+            event (str): event from the view.
+            values (dict): values from the view.
         Returns:
-            _type_: self.go() or None.
+            str: the state after the event, 'quit' once the game is over.
         """
-        self.view.display()
-        while True:  
-            event,_ = self.get_events_values()          
-            if event == 'Quit':
-                break
-            if event == 'Start' or event == 'Next Round' or event == 'Fold':        
-                if self.start_round() is not None:
-                    self.gameover()
-                    event,_ = self.get_events_values()          
-                    if event == 'Quit':
-                        return
-                    elif event == 'Play Again':
-                        #self.model.user.money = self.model.user.INITIAL_MONEY
-                        #self.model.deck
-                        self.model = Model()
-                        self.view = View(self.model)
-                        self.view.curr_display = 'prebet'
-                        return self.go()
-                if self.play_round() is not None:
-                    continue
-                self.end_round()
+        if event in self.QUIT_EVENTS:
+            self.state = 'quit'
+        elif event != self.TIMEOUT_EVENT:
+            self.handlers[self.state](event, values)
+        return self.state
+
+    def go(self, timeout=None):
+        """Runs the game, blocking on the view for each event until the user quits.
+        Args:
+            timeout (int): milliseconds to wait for an event before the read returns a timeout,
+            None to block until one arrives. Defaults to None.
+        """
+        self.enter('menu')
+        while self.state != 'quit':
+            event, values = self.get_events_values(timeout=timeout)
+            self.handle_event(event, values)
+        self.view.close()
 
     def gameover(self):
         """Calls the gameover display if conditions are met."""
-        self.view.curr_display = 'gameover'
-        self.view.display()
-    
+        self.enter('gameover')
+
     def query_pair_plus(self):
         """Updates view to the prebet display."""
         self.view.curr_display = 'prebet'
@@ -124,9 +166,11 @@ class Controller:
         """Updates ciew to bet display."""
         self.view.curr_display = 'bet'
         self.view.display()
-        
-    def get_events_values(self):
+
+    def get_events_values(self, timeout=None):
         """Retrieves the events and values given from the view
+        Args:
+            timeout (int): milliseconds to wait for an event, None to block. Defaults to None.
         Returns:
             events, values: value changes and events triggered in the view"""
-        return self.view.get_events_values()
+        return self.view.get_events_values(timeout=timeout)
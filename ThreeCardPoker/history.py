@@ -0,0 +1,175 @@
+"""Append-only hand history of fixed-size binary records.
+
+Each record is 32 little-endian bytes:
+    cards      6 x uint8   card codes, the user's three then the dealer's
+    decision   uint8       0 folded, 1 played
+    reserved   uint8
+    ante       int32       cents
+    play       int32       cents, 0 if folded
+    pair_plus  int32       cents
+    payout     int32       cents returned to the user, stakes included
+    seed       uint64      seed the round was dealt from, 0 if unseeded
+after an 8 byte header, amounts in cents as Model holds them. Records are packed into a buffer
+and written a batch at a time.
+
+Set THREE_CARD_POKER_HISTORY to a file path before running main.py to record every round.
+Summarize a file from the ThreeCardPoker directory with:
+    python -m history hands.bin
+"""
+import atexit
+import os
+import struct
+
+from model.money import format_money
+
+ENV_VAR = 'THREE_CARD_POKER_HISTORY'
+MAGIC = b'3CPHIST1'
+RECORD = struct.Struct('<6BBxiiiiQ')
+# Records buffered before a write
+BATCH_SIZE = 4096
+
+def record_dtype():
+    """Gets the NumPy structured dtype of a record, matching RECORD."""
+    import numpy as np
+    return np.dtype([('cards', 'u1', (6,)), ('decision', 'u1'), ('reserved', 'u1'), ('ante', '<i4'),
+                     ('play', '<i4'), ('pair_plus', '<i4'), ('payout', '<i4'), ('seed', '<u8')])
+
+class HistoryWriter:
+    """This class represents an open hand history file. Records are packed into a preallocated
+    buffer and only written once BATCH_SIZE of them are waiting, on flush() or on close()."""
+    def __init__(self, path, batch_size=BATCH_SIZE):
+        """Opens a history file for appending, writing the header if it is new. A record cut short
+        by a crash is dropped first, so the records appended after it stay aligned.
+        Args:
+            path (str): history file.
+            batch_size (int): records buffered before a write. Defaults to BATCH_SIZE.
+        Raises:
+            ValueError: if the file exists and is not a hand history.
+        """
+        self.file = open(path, 'ab+')
+        self.file.seek(0)
+        header = self.file.read(len(MAGIC))
+        if not header:
+            self.file.write(MAGIC)
+        elif header != MAGIC:
+            self.file.close()
+            raise ValueError(f'Not a hand history: {path}')
+        else:
+            self.file.truncate(len(MAGIC) + _whole_records(self.file.seek(0, os.SEEK_END)) * RECORD.size)
+        self.buffer = bytearray(RECORD.size * batch_size)
+        self.batch_size = batch_size
+        self.pending = 0
+
+    def append(self, cards, played, ante, play, pair_plus, payout, seed=None):
+        """Adds a record.
+        Args:
+            cards (iterable): six card codes, the user's three then the dealer's.
+            played (bool): True if the user played, False if they folded.
+            ante (int): ante bet, in cents.
+            play (int): play wager in cents, 0 if the user folded.
+            pair_plus (int): pair plus bet, in cents.
+            payout (int): amount returned to the user in cents, stakes included.
+            seed (int): seed the round was dealt from. Defaults to None.
+        """
+        RECORD.pack_into(self.buffer, self.pending * RECORD.size, *cards, played, ante, play, pair_plus, payout, seed or 0)
+        self.pending += 1
+        if self.pending == self.batch_size:
+            self.flush()
+
+    def record(self, model):
+        """Adds a record of the round a model has just settled.
+        Args:
+            model (Model): model after settle_round().
+        """
+        user, dealer = model.get_cards_on_table()
+        self.append([card.code for card in user + dealer], not model.folded, model.ante,
+                    0 if model.folded else model.pot - model.ante,
+                    # settle_round() clears pair_plus once it is paid, so the stake is recovered from the net
+                    model.payout - model.net - model.pot, model.payout, model.deck.seed)
+
+    def flush(self):
+        """Writes every buffered record."""
+        if self.pending:
+            self.file.write(memoryview(self.buffer)[:self.pending * RECORD.size])
+            self.file.flush()
+            self.pending = 0
+
+    def close(self):
+        """Writes every buffered record and closes the file."""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _whole_records(size) -> int:
+    """Counts the whole records in a history file of 'size' bytes."""
+    return (size - len(MAGIC)) // RECORD.size
+
+def _records(path) -> int:
+    """Checks the header of a history file and counts its whole records."""
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'Not a hand history: {path}')
+    return _whole_records(os.path.getsize(path))
+
+def read_history(path):
+    """Memory-maps a history file without parsing it. A record cut short by a crash is left out.
+    Args:
+        path (str): history file.
+    Raises:
+        ValueError: if the file is not a hand history.
+    Returns:
+        numpy.ndarray: read-only structured array of record_dtype().
+    """
+    import numpy as np
+    count = _records(path)
+    if not count:
+        return np.empty(0, dtype=record_dtype())
+    return np.memmap(path, dtype=record_dtype(), mode='r', offset=len(MAGIC), shape=(count,))
+
+def iter_history(path):
+    """Reads a history file record by record without NumPy.
+    Args:
+        path (str): history file.
+    Yields:
+        tuple: fields of a record in RECORD order, the six cards first.
+    """
+    count = _records(path)
+    with open(path, 'rb') as file:
+        file.seek(len(MAGIC))
+        yield from RECORD.iter_unpack(file.read(count * RECORD.size))
+
+def open_from_env():
+    """Opens the history file named by THREE_CARD_POKER_HISTORY, closed on exit.
+    Returns:
+        HistoryWriter: the open history, None if the variable is not set.
+    """
+    path = os.environ.get(ENV_VAR)
+    if not path:
+        return None
+    writer = HistoryWriter(path)
+    atexit.register(writer.close)
+    return writer
+
+def main(argv=None):
+    """Parses the command line and summarizes a history file."""
+    from argparse import ArgumentParser
+    parser = ArgumentParser(prog='python -m history', description='Summarize a hand history file.')
+    parser.add_argument('path', help='hand history file')
+    args = parser.parse_args(argv)
+
+    records = read_history(args.path)
+    wagered = records['ante'].sum(dtype='i8') + records['play'].sum(dtype='i8') + records['pair_plus'].sum(dtype='i8')
+    net = records['payout'].sum(dtype='i8') - wagered
+    print(f'Rounds:     {len(records)}')
+    print(f'Played:     {int(records["decision"].sum(dtype="i8"))}')
+    print(f'Wagered:    {format_money(int(wagered))}')
+    print(f'Net:        {format_money(int(net))}')
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,10 @@
+import profiling
+profiling.enable_from_env() #Times round stages when THREE_CARD_POKER_PROFILE is set
+import history
+
 from model.model import Model
 from controller.controller import Controller
 model = Model()
-controller = Controller(model=model)
+controller = Controller(model=model, history=history.open_from_env()) #Records rounds when THREE_CARD_POKER_HISTORY is set
 
 controller.go() #Runs game
@@ -1,4 +1,5 @@
 from enum import Enum
+from model.hand_rank import card_code
 
 class Card:
     class CardSuit(Enum):
@@ -37,20 +38,40 @@ class Card:
         KING = 13
         ACE = 14
     
-    def __init__(self, card_value: CardValue, card_suit: CardSuit, face_up: bool) -> object:
-        """Constructs the class for cards where each card has a value, suit, and face-up option
+    __slots__ = ('code', 'mask', 'card_value', 'card_suit')
+
+    def __new__(cls, card_value: CardValue, card_suit: CardSuit) -> object:
+        """Gets the card with the given value and suit. Cards are interned, so only the 52
+        instances in Card.ALL ever exist and every lookup returns one of them.
         Args:
-            card_value (CardValue): value of the card.
+            card_value (CardValue): value of the card, as a CardValue or an int from 2 to 14.
             card_suit (CardSuit): suit and color of card.
-            face_up (bool): determines if the card will be shown face up or down
         Returns:
             object: card.
         """
-        self.card_value = card_value
-        self.card_suit = card_suit
-        self.face_up = face_up
-        
-        
+        value = card_value.value if isinstance(card_value, Card.CardValue) else card_value
+        return cls.ALL[card_code(value, cls.SUITS.index(card_suit))]
+
+    @classmethod
+    def from_code(cls, code: int) -> object:
+        """Gets the card with the given code.
+        Args:
+            code (int): card code from 0 to 51, value in the upper bits and suit in the lowest two.
+        Returns:
+            object: card.
+        """
+        return cls.ALL[code]
+
+    @classmethod
+    def _intern(cls, code: int) -> object:
+        """Creates the single instance of the card with the given code."""
+        card = object.__new__(cls)
+        card.code = code
+        card.mask = 1 << code
+        card.card_value = (code >> 2) + 2
+        card.card_suit = cls.SUITS[code & 3]
+        return card
+
     def get_color(self):
         """Gets the color of the card.
         Returns:
@@ -74,8 +95,12 @@ class Card:
         return self.card_value < other.card_value
     
     def __hash__(self) -> int:
-        """Overrides hash function to return the hash value of the state of the card."""
-        if self.face_up == False:
-            return 0
-        else:
-            return hash(self.card_value) + hash(self.card_suit) + 1
+        """Overrides hash function to return the card code, which never changes."""
+        return self.code
+
+    def __reduce__(self):
+        """Pickles the card by code so unpickling returns the interned instance."""
+        return Card.from_code, (self.code,)
+
+Card.SUITS = tuple(Card.CardSuit)
+Card.ALL = tuple(Card._intern(code) for code in range(52))
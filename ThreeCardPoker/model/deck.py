@@ -1,39 +1,83 @@
-from random import sample
+import os
+import random
 from model.card import Card
 
+def new_seed() -> int:
+    """Draws a fresh 64 bit seed for Deck.reset() from the operating system, without loading the
+    secrets module.
+    Returns:
+        int: seed.
+    """
+    return int.from_bytes(os.urandom(8), 'little')
+
 class Deck:
     """This represents the class for the deck."""
-    def __init__(self):
-        """Constructs the class Deck(). Creates a set of all 52 cards with value and suit."""
-        self.cards = set()
-        for card_value in range(2, 15):
-            for card_suit in Card.CardSuit:
-                self.cards.add(Card(card_value=card_value, card_suit=card_suit, face_up=True))
+    SIZE = 52
 
+    def __init__(self, rng=None):
+        """Constructs the class Deck(). Creates a list of all 52 cards with value and suit, where
+        the cards before the 'dealt' cursor are out of the deck and the rest remain to be dealt.
+        Args:
+            rng (random.Random): random number generator the deck draws from. Defaults to the
+            global one in the random module.
+        """
+        self.cards = list(Card.ALL)
+        self.dealt = 0
+        self.rng = random if rng is None else rng
+        self.seed = None
 
-    def get_n_cards(self, n, face_up: bool):
-        """Gets 'n' cards as a random sample and returns said cards
-        and if they are face up or not
+    def get_n_cards(self, n):
+        """Gets 'n' cards as a random sample and returns said cards. The sample is drawn with a
+        partial Fisher-Yates shuffle, swapping each drawn card to the front of the remaining cards
+        and moving the 'dealt' cursor past it.
         Args:
             n (int): number of cards.
-            face_up (bool): determines if the card is faced up or not
+        Raises:
+            ValueError: if fewer than 'n' cards remain in the deck.
         Returns:
             tuple: 'n' amount of cards in a tuple.
         """
-        n_cards = sample(self.cards, n)
-        for card in n_cards:
-            self.cards.remove(card)
-            card.face_up = face_up
-            
-        return tuple(n_cards)
-    
+        cards = self.cards
+        draw = self.rng.random
+        start = self.dealt
+        end = start + n
+        if end > self.SIZE:
+            raise ValueError('Not enough cards remaining in the deck')
+
+        for i in range(start, end):
+            j = i + int(draw() * (self.SIZE - i))
+            cards[i], cards[j] = cards[j], cards[i]
+        self.dealt = end
+        return tuple(cards[start:end])
+
     def return_used_cards(self, used_cards):
-        """Returns cards back to the deck.
+        """Returns cards back to the deck by swapping each one behind the 'dealt' cursor.
         Args:
             used_cards (tuple): said cards to be returned to the deck.
         """
+        cards = self.cards
         for card in used_cards:
-            self.cards.add(card)
+            i = cards.index(card, 0, self.dealt)
+            self.dealt -= 1
+            cards[i], cards[self.dealt] = cards[self.dealt], cards[i]
+
+    def reset(self, seed=None):
+        """Returns every dealt card back to the deck by resetting the 'dealt' cursor.
+        Args:
+            seed (int): if given, also restores the original card order and reseeds the deck's own
+            generator, so the deals that follow are reproduced by the same seed. Defaults to None.
+        """
+        self.dealt = 0
+        if seed is not None:
+            if self.rng is random:
+                self.rng = random.Random()
+            self.rng.seed(seed)
+            self.cards[:] = Card.ALL
+        self.seed = seed
+
+    def __len__(self) -> int:
+        """Number of cards remaining in the deck."""
+        return self.SIZE - self.dealt
 
     def __repr__(self) -> str:
         """String representation of the Deck. Returns amount of cards
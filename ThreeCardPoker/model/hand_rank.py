@@ -0,0 +1,116 @@
+from enum import Enum
+from itertools import combinations, combinations_with_replacement
+
+class HandType(Enum):
+    """This class represents the possible hands that can be obtained"""
+    HIGH_CARD = 0
+    PAIR = 1
+    FLUSH = 2
+    STRAIGIHT = 3
+    THREE_OF_A_KIND = 4
+    STRAIGHT_FLUSH = 5
+
+    def __gt__(self, other):
+        """Greater than override."""
+        return self.value > other.value
+
+    def __le__(self, other):
+        """Less than or equal to override."""
+        return self.value <= other.value
+
+# HandType members indexed by value so a rank maps back to its type without an Enum call
+HAND_TYPES = tuple(HandType)
+
+# A rank packs the hand type above three 4-bit card values, highest first:
+#   rank = hand_type << 12 | a << 8 | b << 4 | c
+# Pairs are stored as (pair, pair, kicker) and the A-2-3 straight as (3, 2, 1),
+# so comparing two ranks as integers orders hands with full kicker resolution.
+HAND_TYPE_SHIFT = 12
+# Rank of the weakest high card hand the textbook strategy still plays: queen, six, four
+Q64_RANK = HandType.HIGH_CARD.value << HAND_TYPE_SHIFT | 12 << 8 | 6 << 4 | 4
+
+def card_code(card_value: int, suit_index: int) -> int:
+    """Gets the 0-51 code of a card.
+    Args:
+        card_value (int): value of the card, 2 through 14.
+        suit_index (int): position of the suit in Card.CardSuit, 0 through 3.
+    Returns:
+        int: card code, with the value in the upper bits and the suit in the lowest two.
+    """
+    return (card_value - 2) << 2 | suit_index
+
+def rank_codes(codes) -> int:
+    """Ranks three card codes from scratch. Used to build the lookup table.
+    Args:
+        codes (iterable): three card codes.
+    Returns:
+        int: packed rank of the hand.
+    """
+    values = sorted(((code >> 2) + 2 for code in codes), reverse=True)
+    flush = len(set(code & 3 for code in codes)) == 1
+    if values == [14, 3, 2]:
+        values = [3, 2, 1]
+    straight = values[0] - values[2] == 2 and len(set(values)) == 3
+
+    if straight and flush:
+        hand_type = HandType.STRAIGHT_FLUSH
+    elif values[0] == values[2]:
+        hand_type = HandType.THREE_OF_A_KIND
+    elif straight:
+        hand_type = HandType.STRAIGIHT
+    elif flush:
+        hand_type = HandType.FLUSH
+    elif values[0] == values[1] or values[1] == values[2]:
+        hand_type = HandType.PAIR
+        if values[1] == values[2]:
+            values = [values[1], values[2], values[0]]
+    else:
+        hand_type = HandType.HIGH_CARD
+
+    return hand_type.value << HAND_TYPE_SHIFT | values[0] << 8 | values[1] << 4 | values[2]
+
+def _build_table() -> dict:
+    """Ranks every one of the C(52, 3) = 22,100 three card hands. A rank only depends on the three
+    values and whether the suits match, so each value triple is ranked once, suited and unsuited,
+    and every hand takes its rank from there, which keeps the table cheap to build at import.
+    Returns:
+        dict: maps the bitmask of a hand's three card codes to its rank.
+    """
+    plain = [0] * 13 ** 3
+    suited = [0] * 13 ** 3
+    for x, y, z in combinations_with_replacement(range(13), 3):
+        i = x * 169 + y * 13 + z
+        plain[i] = rank_codes((x << 2, y << 2 | 1, z << 2 | 2))
+        if x != y != z:
+            suited[i] = rank_codes((x << 2, y << 2, z << 2))
+
+    table = {}
+    for a, b, c in combinations(range(52), 3):
+        i = (a >> 2) * 169 + (b >> 2) * 13 + (c >> 2)
+        table[1 << a | 1 << b | 1 << c] = suited[i] if a & 3 == b & 3 == c & 3 else plain[i]
+    return table
+
+HAND_RANKS = _build_table()
+
+def rank_hand(cards) -> int:
+    """Looks up the rank of a three card hand.
+    Args:
+        cards (tuple): three cards, each carrying its bitmask in 'mask'.
+    Returns:
+        int: packed rank of the hand, higher is better.
+    """
+    a, b, c = cards
+    try:
+        return HAND_RANKS[a.mask | b.mask | c.mask]
+    except KeyError:
+        # Only a multi-deck shoe deals the same card twice in a hand, which the table cannot hold
+        return rank_codes((a.code, b.code, c.code))
+
+def hand_type(rank: int) -> HandType:
+    """Gets the hand type of a rank.
+    Args:
+        rank (int): packed rank from the lookup table.
+    Returns:
+        HandType: type of the hand.
+    """
+    return HAND_TYPES[rank >> HAND_TYPE_SHIFT]
@@ -1,100 +1,157 @@
-from model.player import User, Dealer, HandType
+from model.player import User, Dealer
 from model.deck import Deck
+from model.rules import STANDARD_RULES
 
 class Model:
     """This class represents the game's model"""
-    def __init__(self, user=User(), dealer=Dealer(), deck=Deck(), pot=0, pair_plus=0) -> None:
+    def __init__(self, user=None, dealer=None, deck=None, pot=0, pair_plus=0, rules=STANDARD_RULES) -> None:
         """Constructs a model for the basis of the game. Controls the actions the user can
         perform such as folding, controlling the betting, dealing hands as well as comparing them.
         Args:
-            user (_type_): Calls the user's functions. Defaults to User().
-            dealer (_type_: Calls the dealer's functions. Defaults to Dealer().
-            deck (_type_): Calls the deck's functions. Defaults to Deck().
-            pot (int): Accumulates balance to return to the user if won. Defaults to 0.
+            user (_type_): Calls the user's functions. Defaults to a new User().
+            dealer (_type_: Calls the dealer's functions. Defaults to a new Dealer().
+            deck (_type_): Calls the deck's functions. Defaults to a new Deck().
+            pot (int): Accumulates balance, in cents, to return to the user if won. Defaults to 0.
             pair_plus (int): Returns appropriete amount dependent on the user's hand. Defaults to 0.
+            rules (Rules): paytables, limits and dealer qualifier of the table. Defaults to STANDARD_RULES.
         """
-        self.user = user
-        self.dealer = dealer
-        self.deck = deck
+        self.user = User() if user is None else user
+        self.dealer = Dealer() if dealer is None else dealer
+        self.deck = Deck() if deck is None else deck
         self.pot = pot
         self.pair_plus = pair_plus
+        self.rules = rules
+        self.ante = 0
+        self.folded = False
+        self.payout = 0
+        self.net = 0
         self.round_over = False
         self.game_over = False
         self.winner = None
         
+    def new_round(self, seed=None):
+        """Clears the bets, hands and flags of the last round and returns every card to the deck.
+        Args:
+            seed (int): seed the round is dealt from, see Deck.reset(). Defaults to None.
+        """
+        self.winner = None
+        self.round_over = False
+        self.game_over = False
+        self.pot = 0
+        self.pair_plus = 0
+        self.ante = 0
+        self.folded = False
+        self.payout = 0
+        self.net = 0
+
+        self.user.discard_hand()
+        self.dealer.discard_hand()
+        self.deck.reset(seed)
+
+    def reset(self):
+        """Recycles the model for a new session: clears the round and restores the user's initial money,
+        keeping the same user, dealer and deck."""
+        self.new_round()
+        self.user.money = self.user.INITIAL_MONEY
+
     def place_pair_plus(self, amount):
-        """Places pair plus bet in the game.
+        """Places pair plus bet in the game. A bet of 0 skips pair plus for the round.
         Args:
-            amount (float): amount to be placed as bet, goes through place_bet().
+            amount (int): amount in cents to be placed as bet, goes through place_bet().
+        Raises:
+            TypeError: if the amount is not whole cents.
+            ValueError: if the amount is outside the table limits or more than the user's money.
         """
+        if not isinstance(amount, int):
+            raise TypeError('amount must be whole cents')
+        if amount:
+            self.rules.check_bet(amount)
         self.user.place_bet(amount=amount)
         self.pair_plus = amount
     
     def place_bet(self, amount):
         """General bet placing function to add amount to pot and interact with user's place bet function.
         Args:
-            amount (float): amount to be added and used for user.place_bet().
+            amount (int): amount in cents to be added and used for user.place_bet().
         """
         self.user.place_bet(amount=amount)
         self.pot += amount
 
+    def place_ante(self):
+        """Places the table's ante for the round.
+        Raises:
+            ValueError: if the user cannot cover the ante.
+        """
+        self.place_bet(amount=self.rules.ante)
+        self.ante = self.rules.ante
+
+    def place_play(self, amount):
+        """Places the play wager, the bet to keep playing the hand against the dealer.
+        Args:
+            amount (int): amount in cents to be placed as bet, goes through place_bet().
+        Raises:
+            ValueError: if the amount is outside the table limits or more than the user's money.
+        """
+        self.rules.check_bet(amount)
+        self.place_bet(amount=amount)
+
     def get_pair_plus(self):
         """Assesses user's hand to see if the hand contains a pair, flush, straight,
         three of a kind, or straight flush where the user is awarded the appropriete
         amount based on this evaluation.
         Returns:
-            new_amount(float): updates the amount the user will win based on the pair-plus
-            bet. 
+            new_amount(int): updates the amount returned to the user based on the pair-plus
+            bet, stake included.
         """
-        hand_type = self.user.evaluate_hand()[0]
-        new_amount = 0.0
-        if hand_type == HandType.STRAIGHT_FLUSH:
-            new_amount = 40 * self.pair_plus
-            self.user.money += new_amount
-        elif hand_type == HandType.THREE_OF_A_KIND:
-            new_amount = 30 * self.pair_plus
-            self.user.money += new_amount
-        elif hand_type == HandType.STRAIGIHT:
-            new_amount = 6 * self.pair_plus
-            self.user.money += new_amount    
-        elif hand_type == HandType.FLUSH:
-            new_amount = 4 * self.pair_plus
-            self.user.money += new_amount    
-        elif hand_type == HandType.PAIR:
-            new_amount = self.pair_plus
-            self.user.money += new_amount    
-        
+        new_amount = self.rules.pair_plus_payout(self.user.hand_rank(), self.pair_plus)
+        self.user.money += new_amount
         self.pair_plus = 0
         return new_amount
              
     def fold(self):
         """Alters round_over flag to update the view and cause the game to revert back to
-        the pair-plus bet."""
+        the pair-plus bet. The ante is lost when the round is settled."""
+        self.folded = True
+        self.round_over = True
+
+    def get_winnings(self):
+        """Settles the ante and play wager against the dealer's hand under the table's rules.
+        Returns:
+            int: amount returned to the user in cents, stakes included, 0 if the user folded.
+        """
+        play = 0 if self.folded else self.pot - self.ante
+        new_amount = self.rules.settle(self.user.hand_rank(), self.dealer.hand_rank(), self.ante, play)
+        self.user.money += new_amount
+        return new_amount
+
+    def settle_round(self):
+        """Settles every bet of the round and records the amount returned to the user in payout
+        and the user's net win or loss in net.
+        Returns:
+            int: net win or loss of the round, in cents.
+        """
+        wagered = self.pot + self.pair_plus
+        self.payout = self.get_winnings() + self.get_pair_plus()
+        self.net = self.payout - wagered
         self.round_over = True
+        return self.net
     
     def deal_hands(self):
         """Deals the hands of both the user and dealer where both get 3 cards with
         user's cards faced up and dealer's cards faced down."""
-        self.user.set_hand(self.deck.get_n_cards(n=3, face_up=True))
-        self.dealer.set_hand(self.deck.get_n_cards(n=3, face_up=False))
+        self.user.set_hand(self.deck.get_n_cards(n=3), face_up=True)
+        self.dealer.set_hand(self.deck.get_n_cards(n=3), face_up=False)
     
     def compare_hands(self):
-        """Using evaluate.hand() from user/dealer, compares the tuple returned by the function
-        by first using the handtype of the hand and if the same, compares highcard to determine
+        """Using hand_rank() from user/dealer, compares the ranks looked up for both hands,
+        which order the hands by handtype first and then by every card in the hand to determine
         the winner.
         Returns:
-            self.winner(flag): winner of the round to be used in controller, if true, the user wins, if not,
-            dealer wins and no money from the play-wager is awarded.
+            self.winner(flag): winner of the round to be used in the view, if true, the user's hand beats
+            the dealer's, if not, the dealer's hand is as good or better.
         """
-        user_hand = self.user.evaluate_hand()
-        dealer_hand = self.dealer.evaluate_hand()
-        
-        if user_hand[0] == dealer_hand[0]:
-            self.winner = user_hand[1] > dealer_hand[1]
-            return self.winner
-        else:
-            self.winner = user_hand[0] > dealer_hand[0]
-            return self.winner
+        self.winner = self.user.hand_rank() > self.dealer.hand_rank()
+        return self.winner
         
     def get_pot(self):
         """Retrieves the amount that was placed as a bet throughout the round.
@@ -0,0 +1,18 @@
+from decimal import Decimal, ROUND_HALF_EVEN
+
+# Money is held as whole cents everywhere, so balances and sums stay exact
+CENTS = 100
+
+def to_cents(amount) -> int:
+    """Converts an amount of dollars, such as a slider value, to whole cents.
+    Args:
+        amount (int, float, str or Decimal): amount in dollars, rounded half to even to the cent.
+    Returns:
+        int: amount in cents.
+    """
+    return int((Decimal(str(amount)) * CENTS).quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+
+def format_money(cents) -> str:
+    """Formats an amount of cents as dollars, such as '$1,250.50' or '-$25.00'."""
+    dollars, rest = divmod(abs(cents), CENTS)
+    return f'{"-" if cents < 0 else ""}${dollars:,}.{rest:02d}'
@@ -0,0 +1,141 @@
+from model.deck import Deck
+from model.hand_rank import rank_hand
+from model.player import User, Dealer
+from model.rules import STANDARD_RULES
+
+class Seat:
+    """This class represents a seat at a multi-seat table: its user and the bets of the round."""
+    def __init__(self, user=None):
+        """Constructs an empty seat.
+        Args:
+            user (User): the seated user. Defaults to a new User().
+        """
+        self.user = User() if user is None else user
+        self.clear()
+
+    def clear(self):
+        """Clears the bets and results of the last round. A seat only plays a round once its ante is placed."""
+        self.in_round = False
+        self.ante = 0
+        self.play = 0
+        self.pair_plus = 0
+        self.folded = False
+        self.winner = None
+        self.payout = 0
+        self.net = 0
+
+class MultiSeatModel:
+    """This class represents a table of up to MAX_SEATS users against one dealer hand. Every seat
+    in the round is dealt from one draw of the shared deck, and settle_round() ranks the dealer's
+    hand once and settles every seat against it in one pass."""
+    MAX_SEATS = 6
+
+    def __init__(self, seats=MAX_SEATS, dealer=None, deck=None, rules=STANDARD_RULES) -> None:
+        """Constructs a table.
+        Args:
+            seats (int or list): number of seats, each with a new User, or the users to seat. Defaults to MAX_SEATS.
+            dealer (Dealer): the dealer. Defaults to a new Dealer().
+            deck (Deck): the shared deck. Defaults to a new Deck().
+            rules (Rules): paytables, limits and dealer qualifier of the table. Defaults to STANDARD_RULES.
+        Raises:
+            ValueError: if there are no seats or more than MAX_SEATS.
+        """
+        users = [User() for _ in range(seats)] if isinstance(seats, int) else list(seats)
+        if not 1 <= len(users) <= self.MAX_SEATS:
+            raise ValueError(f'A table seats 1 to {self.MAX_SEATS} users')
+        self.seats = [Seat(user) for user in users]
+        self.dealer = Dealer() if dealer is None else dealer
+        self.deck = Deck() if deck is None else deck
+        self.rules = rules
+        self.dealer_rank = None
+
+    def new_round(self, seed=None):
+        """Clears every seat and the dealer's hand and returns every card to the deck.
+        Args:
+            seed (int): seed the round is dealt from, see Deck.reset(). Defaults to None.
+        """
+        for seat in self.seats:
+            seat.clear()
+            seat.user.discard_hand()
+        self.dealer.discard_hand()
+        self.dealer_rank = None
+        self.deck.reset(seed)
+
+    def place_ante(self, seat):
+        """Places the table's ante for a seat, joining it to the round.
+        Args:
+            seat (int): index of the seat.
+        Raises:
+            ValueError: if the user cannot cover the ante.
+        """
+        seat = self.seats[seat]
+        seat.user.place_bet(amount=self.rules.ante)
+        seat.ante = self.rules.ante
+        seat.in_round = True
+
+    def place_pair_plus(self, seat, amount):
+        """Places a seat's pair plus bet. A bet of 0 skips pair plus for the round.
+        Args:
+            seat (int): index of the seat.
+            amount (int): amount in cents to be placed as bet.
+        Raises:
+            ValueError: if the amount is outside the table limits or more than the user's money.
+        """
+        if amount:
+            self.rules.check_bet(amount)
+        seat = self.seats[seat]
+        seat.user.place_bet(amount=amount)
+        seat.pair_plus = amount
+
+    def place_play(self, seat, amount):
+        """Places a seat's play wager.
+        Args:
+            seat (int): index of the seat.
+            amount (int): amount in cents to be placed as bet.
+        Raises:
+            ValueError: if the amount is outside the table limits or more than the user's money.
+        """
+        self.rules.check_bet(amount)
+        seat = self.seats[seat]
+        seat.user.place_bet(amount=amount)
+        seat.play = amount
+
+    def fold(self, seat):
+        """Folds a seat, losing its ante when the round is settled.
+        Args:
+            seat (int): index of the seat.
+        """
+        self.seats[seat].folded = True
+
+    def playing(self) -> list:
+        """Gets the seats in the round, in seat order."""
+        return [seat for seat in self.seats if seat.in_round]
+
+    def deal_hands(self):
+        """Deals three cards to every seat in the round and to the dealer from a single draw, the
+        seats face up and the dealer face down."""
+        seats = self.playing()
+        cards = self.deck.get_n_cards(n=3 * len(seats) + 3)
+        for i, seat in enumerate(seats):
+            seat.user.set_hand(cards[3 * i:3 * i + 3], face_up=True)
+        self.dealer.set_hand(cards[-3:], face_up=False)
+
+    def settle_round(self):
+        """Ranks the dealer's hand once and settles every seat in the round against it, recording
+        each seat's payout, net and winner.
+        Returns:
+            list: net win or loss in cents of each seat in the round, in seat order.
+        """
+        rules = self.rules
+        self.dealer_rank = dealer_rank = rank_hand(self.dealer.hand)
+        nets = []
+        for seat in self.playing():
+            user_rank = rank_hand(seat.user.hand)
+            play = 0 if seat.folded else seat.play
+            seat.winner = not seat.folded and user_rank > dealer_rank
+            seat.payout = rules.settle(user_rank, dealer_rank, seat.ante, play) + rules.pair_plus_payout(user_rank, seat.pair_plus)
+            seat.net = seat.payout - seat.ante - seat.play - seat.pair_plus
+            seat.user.money += seat.payout
+            nets.append(seat.net)
+        self.dealer.reveal_hand()
+        return nets
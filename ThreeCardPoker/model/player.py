@@ -1,38 +1,25 @@
 from abc import ABC
-from enum import Enum
+from model.money import CENTS
+from model.hand_rank import HandType, HAND_TYPES, HAND_TYPE_SHIFT, rank_hand
 
-class HandType(Enum):
-    """This class represents the possible hands that can be obtained"""
-    HIGH_CARD = 0
-    PAIR = 1
-    FLUSH = 2
-    STRAIGIHT = 3
-    THREE_OF_A_KIND = 4
-    STRAIGHT_FLUSH = 5
-
-    def __gt__(self, other):
-        """Greater than override."""
-        return self.value > other.value
-
-    def __le__(self, other):
-        """Less than or equal to override."""
-        return self.value <= other.value
-        
 class Player(ABC):
     """This class represents the actions of the user or dealer (abstract)"""
     def __init__(self):
         """Constructs the Player abstract class."""
         self.hand = tuple()
+        self.face_up = True
         
-    def set_hand(self, cards: tuple):
+    def set_hand(self, cards: tuple, face_up: bool = True):
         """Sets the hand of the player.
         Args:
             cards (tuple): Cards that the hand is set as in a tuple.
+            face_up (bool): determines if the hand is shown face up or down. Defaults to True.
         Raises:
             TypeError: if cards do not get set as a tuple while this function is called.
         """
         if isinstance(cards, tuple): 
             self.hand = cards
+            self.face_up = face_up
         else:
             raise TypeError('cards must be a tuple')
 
@@ -41,62 +28,22 @@ class Player(ABC):
         self.hand = tuple()
         return temp
     
-    def has_pair(self):
-        """Checks to see if hand has a pair.
-        Returns:
-            int: if the length of hand returns as 2, the user has a pair since
-            duplicates are disregarded.
-        """
-        return len(set([card.card_value for card in self.hand])) == 2
-    
-    def has_flush(self):
-        """Checks hand for flush.
+    def hand_rank(self):
+        """Looks up the rank of the hand in the precomputed hand rank table.
         Returns:
-            int: if the length of hand returns as 1, the user has a flush since
-            duplicates are disregarded. Suit of card is evaluated.
+            int: rank of the hand, where a higher rank beats a lower one and equal ranks tie.
         """
-        return len(set([card.card_suit for card in self.hand])) == 1
-    
-    def has_straight(self):
-        """Checks hand for a straight.
-        Returns:
-            tuple: checks values of cards and sorts them as 1, 2, 3 if in sequential order 
-            and returns a straight if conditions are met.
-        """
-        sorted_hand = sorted(self.hand)
-        lowest_card_val = sorted_hand[0].card_value - 1
-        sorted_hand = [x.card_value - lowest_card_val for x in sorted_hand]
-        return sorted_hand == (1, 2, 3)
-    
-    def has_three_pair(self):
-        """Checks hand for three of a kind.
-        Returns:
-            int: if the length of hand returns as 1, the user has a flush since
-            duplicates are disregarded. Value of card is evaluated.
-        """        
-        return len(set([card.card_value for card in self.hand])) == 1
-    
+        return rank_hand(self.hand)
+
     def evaluate_hand(self):
         """Evaluates the hand of the Player and returns a tuple containing
-        handtype and highcard so when comparing two hands it can determine the winner of the
+        handtype and rank so when comparing two hands it can determine the winner of the
         round based on either parameter if the handtype returns the same
         Returns:
-            tuple(HandType, High Card): returns the user's hand as a tuple
+            tuple(HandType, int): returns the user's hand type and rank as a tuple
         """
-        highest_card = max(self.hand)
-        
-        if self.has_straight() and self.has_flush():
-            return HandType.STRAIGHT_FLUSH, highest_card
-        elif self.has_three_pair():
-            return HandType.THREE_OF_A_KIND, highest_card
-        elif self.has_straight():
-            return HandType.STRAIGIHT, highest_card
-        elif self.has_flush():
-            return HandType.FLUSH, highest_card
-        elif self.has_pair():
-            return HandType.PAIR, highest_card
-        else:
-            return HandType.HIGH_CARD, highest_card
+        rank = rank_hand(self.hand)
+        return HAND_TYPES[rank >> HAND_TYPE_SHIFT], rank
         
 class Dealer(Player):
     """This class represents the dealer's parameters"""
@@ -106,18 +53,17 @@ class Dealer(Player):
         super().__init__() 
     
     def reveal_hand(self):
-        """Changes bool value of card to be interpreted by the view to show the cards"""
-        for card in self.hand:
-            card.face_up = True
+        """Changes bool value of the hand to be interpreted by the view to show the cards"""
+        self.face_up = True
 
 class User(Player):
     """This class represents the user's parameters"""
-    INITIAL_MONEY = 250.0
+    INITIAL_MONEY = 250 * CENTS
     
     def __init__(self, money=INITIAL_MONEY):
         """Constructs the user class as a subclass of player.
         Args:
-            money (float): Overall balence of the player. Defaults to INITIAL_MONEY.
+            money (int): Overall balence of the player in cents. Defaults to INITIAL_MONEY.
         """
         super().__init__()
         self.money = money
@@ -125,10 +71,13 @@ class User(Player):
     def place_bet(self, amount):
         """Removes money from the user's money in game when prompted to bet
         Args:
-            amount (_type_): amount the user has bet on the round
+            amount (int): amount the user has bet on the round, in cents
         Raises:
+            TypeError: if the amount is not whole cents
             ValueError: if the user places a bet larger the balence in money
         """
+        if not isinstance(amount, int):
+            raise TypeError('amount must be whole cents')
         if amount > self.money:
             raise ValueError('Invalid Bet: Insufficient Funds')
         else:
@@ -0,0 +1,151 @@
+from model.hand_rank import HandType, HAND_TYPE_SHIFT
+from model.money import CENTS
+
+class Rules:
+    """This class represents the rules of a table: the pair plus and ante bonus paytables, what the
+    ante and play wager pay, the hand the dealer needs to qualify and the betting limits. Paytables
+    are declared by HandType name in 'X to 1' odds and compiled once into tuples indexed by HandType
+    value, so settling a hand is a single index. Amounts are whole cents and odds are integers, so
+    every payout is exact."""
+    def __init__(self, name='standard', ante=25 * CENTS, min_bet=10 * CENTS, max_bet=None, ante_pays=1, play_pays=1,
+                 pair_plus=None, ante_bonus=None, dealer_qualifier=('HIGH_CARD', 12)) -> None:
+        """Constructs and compiles the rules.
+        Args:
+            name (str): name of the rules. Defaults to 'standard'.
+            ante (int): ante placed each round, in cents. Defaults to $25.
+            min_bet (int): smallest play wager or pair plus bet, in cents. Defaults to $10.
+            max_bet (int): largest play wager or pair plus bet in cents, None for no limit. Defaults to None.
+            ante_pays (int): odds paid on the ante when the user wins. Defaults to 1.
+            play_pays (int): odds paid on the play wager when the user wins. Defaults to 1.
+            pair_plus (dict): odds paid on the pair plus bet by HandType name. Defaults to the README paytable.
+            ante_bonus (dict): odds paid on the ante by HandType name whenever the user plays, win or lose.
+            Defaults to 1 for a straight, 4 for three of a kind and 5 for a straight flush.
+            dealer_qualifier (tuple): (HandType name, high card value) of the weakest hand the dealer
+            qualifies with, None if the dealer always qualifies. Defaults to queen high.
+        Raises:
+            ValueError: if a paytable or the dealer qualifier names a hand that is not a HandType.
+        """
+        self.name = name
+        self.ante = ante
+        self.min_bet = min_bet
+        self.max_bet = max_bet
+        self.ante_pays = ante_pays
+        self.play_pays = play_pays
+        self.pair_plus = dict(pair_plus if pair_plus is not None else
+                              {'PAIR': 1, 'FLUSH': 3, 'STRAIGIHT': 6, 'THREE_OF_A_KIND': 30, 'STRAIGHT_FLUSH': 40})
+        self.ante_bonus = dict(ante_bonus if ante_bonus is not None else
+                               {'STRAIGIHT': 1, 'THREE_OF_A_KIND': 4, 'STRAIGHT_FLUSH': 5})
+        self.dealer_qualifier = tuple(dealer_qualifier) if dealer_qualifier is not None else None
+        for table, names in (('pair_plus', self.pair_plus), ('ante_bonus', self.ante_bonus),
+                             ('dealer_qualifier', self.dealer_qualifier[:1] if self.dealer_qualifier else ())):
+            unknown = [name for name in names if name not in HandType.__members__]
+            if unknown:
+                raise ValueError(f'Unknown HandType in {table}: {", ".join(map(str, unknown))}')
+
+        # Amount returned per unit bet on pair plus, stake included, and ante bonus odds, by HandType value
+        self.pair_plus_returns = tuple(self.pair_plus[t.name] + 1 if t.name in self.pair_plus else 0 for t in HandType)
+        self.ante_bonus_odds = tuple(self.ante_bonus.get(t.name, 0) for t in HandType)
+        # Dealer hands ranked below this do not qualify
+        if self.dealer_qualifier is None:
+            self.qualifier_rank = 0
+        else:
+            qualifier_type, high_card = self.dealer_qualifier
+            self.qualifier_rank = HandType[qualifier_type].value << HAND_TYPE_SHIFT | high_card << 8
+
+    def check_bet(self, amount):
+        """Checks a play wager or pair plus bet against the table limits.
+        Args:
+            amount (int): amount to be bet, in cents.
+        Raises:
+            TypeError: if the amount is not whole cents.
+            ValueError: if the amount is below min_bet or above max_bet.
+        """
+        if not isinstance(amount, int):
+            raise TypeError('amount must be whole cents')
+        if amount < self.min_bet or (self.max_bet is not None and amount > self.max_bet):
+            raise ValueError('Invalid Bet: Outside Table Limits')
+
+    def pair_plus_payout(self, rank, amount):
+        """Gets the amount returned on a pair plus bet, stake included.
+        Args:
+            rank (int): rank of the user's hand.
+            amount (int): pair plus bet, in cents.
+        Returns:
+            int: amount returned in cents, 0 if the bet lost.
+        """
+        return self.pair_plus_returns[rank >> HAND_TYPE_SHIFT] * amount
+
+    def settle(self, user_rank, dealer_rank, ante, play):
+        """Gets the amount returned on the ante and play wager, stakes included. A dealer who does
+        not qualify pays the ante and pushes the play wager, ties push both, and the ante bonus is
+        paid whenever the user plays.
+        Args:
+            user_rank (int): rank of the user's hand.
+            dealer_rank (int): rank of the dealer's hand.
+            ante (int): ante bet, in cents.
+            play (int): play wager in cents, 0 if the user folded.
+        Returns:
+            int: amount returned in cents, 0 if the user folded or lost without an ante bonus.
+        """
+        if not play:
+            return 0
+        returned = ante * self.ante_bonus_odds[user_rank >> HAND_TYPE_SHIFT]
+        if dealer_rank < self.qualifier_rank:
+            return returned + ante * (self.ante_pays + 1) + play
+        if user_rank > dealer_rank:
+            return returned + ante * (self.ante_pays + 1) + play * (self.play_pays + 1)
+        if user_rank == dealer_rank:
+            return returned + ante + play
+        return returned
+
+    def to_dict(self) -> dict:
+        """Gets the declared rules, as read by from_dict()."""
+        return {
+            'name': self.name,
+            'ante': self.ante,
+            'min_bet': self.min_bet,
+            'max_bet': self.max_bet,
+            'ante_pays': self.ante_pays,
+            'play_pays': self.play_pays,
+            'pair_plus': self.pair_plus,
+            'ante_bonus': self.ante_bonus,
+            'dealer_qualifier': list(self.dealer_qualifier) if self.dealer_qualifier is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, rules: dict) -> object:
+        """Constructs rules from a dict of the arguments of Rules().
+        Args:
+            rules (dict): declared rules, missing entries take their defaults.
+        Returns:
+            Rules: compiled rules.
+        """
+        return cls(**rules)
+
+    def digest(self) -> str:
+        """Gets a short hash of everything but the name, which keys tables computed for these rules.
+        Returns:
+            str: hex digest.
+        """
+        import hashlib
+        import json
+        rules = self.to_dict()
+        del rules['name']
+        return hashlib.sha256(json.dumps(rules, sort_keys=True).encode()).hexdigest()[:16]
+
+    def __repr__(self) -> str:
+        """String representation of the rules."""
+        return f'Rules({self.name!r}, {self.digest()})'
+
+def load_rules(path) -> Rules:
+    """Loads rules from a JSON file holding the arguments of Rules().
+    Args:
+        path (str): JSON file.
+    Returns:
+        Rules: compiled rules.
+    """
+    import json
+    with open(path) as file:
+        return Rules.from_dict(json.load(file))
+
+STANDARD_RULES = Rules()
@@ -0,0 +1,210 @@
+import random
+from collections import deque
+from math import comb
+
+from model.card import Card
+from model.hand_rank import HandType
+from model.rules import STANDARD_RULES
+
+# Values of the three cards of each straight, A-2-3 through Q-K-A
+STRAIGHTS = ((14, 2, 3),) + tuple((v, v + 1, v + 2) for v in range(2, 13))
+
+class Shoe:
+    """This class represents a shoe of one or more decks that deals like a Deck (abstract). The
+    cards left to be dealt are counted by card, value and suit, updated as each card is dealt or
+    returned, so the odds of the next hand can be read off the counts without looking at the cards.
+    A shoe keeps its cards between rounds; reset() ends a round and leaves reshuffling to the shoe."""
+    def __init__(self, decks=1, rng=None):
+        """Constructs a shoe holding every card of its decks.
+        Args:
+            decks (int): number of 52 card decks. Defaults to 1.
+            rng (random.Random): random number generator the shoe shuffles with. Defaults to the
+            global one in the random module.
+        """
+        self.decks = decks
+        self.size = decks * len(Card.ALL)
+        self.rng = random if rng is None else rng
+        # A shoe's next deal depends on every round since its last shuffle, so no seed replays it
+        # and hand histories record shoe rounds as unseeded
+        self.seed = None
+        self.code_counts = [decks] * len(Card.ALL)
+        self.value_counts = [4 * decks] * 15
+        self.value_counts[0] = self.value_counts[1] = 0
+        self.suit_counts = [13 * decks] * 4
+        self.remaining = self.size
+
+    def _take(self, card):
+        """Counts a card out of the shoe."""
+        self.code_counts[card.code] -= 1
+        self.value_counts[card.card_value] -= 1
+        self.suit_counts[card.code & 3] -= 1
+        self.remaining -= 1
+
+    def _put(self, card):
+        """Counts a card back into the shoe."""
+        self.code_counts[card.code] += 1
+        self.value_counts[card.card_value] += 1
+        self.suit_counts[card.code & 3] += 1
+        self.remaining += 1
+
+    def _reseed(self, seed):
+        """Reseeds the shoe's own generator, the way Deck.reset() does, without claiming the seed
+        replays the round."""
+        if seed is not None:
+            if self.rng is random:
+                self.rng = random.Random()
+            self.rng.seed(seed)
+
+    def hand_type_counts(self) -> dict:
+        """Counts the three card hands of each HandType that can be drawn from the cards left, in
+        time independent of the size of the shoe. A hand holding the same card twice is counted
+        once per copy, as a multi-deck shoe deals it.
+        Returns:
+            dict: number of hands of each HandType.
+        """
+        codes, values, suits = self.code_counts, self.value_counts, self.suit_counts
+        trips = sum(comb(n, 3) for n in values)
+        suited_trips = sum(comb(n, 3) for n in codes)
+        straight_flushes = sum(codes[(a - 2) << 2 | s] * codes[(b - 2) << 2 | s] * codes[(c - 2) << 2 | s]
+                               for a, b, c in STRAIGHTS for s in range(4))
+        straights = sum(values[a] * values[b] * values[c] for a, b, c in STRAIGHTS) - straight_flushes
+        # Flushes include suited pairs, which outrank a pair
+        suited_pairs = sum(comb(codes[code], 2) * (suits[code & 3] - codes[code]) for code in range(len(codes)))
+        flushes = sum(comb(n, 3) for n in suits) - straight_flushes - suited_trips
+        pairs = sum(comb(n, 2) * (self.remaining - n) for n in values) - suited_pairs
+        return {
+            HandType.HIGH_CARD: comb(self.remaining, 3) - trips - straight_flushes - straights - flushes - pairs,
+            HandType.PAIR: pairs,
+            HandType.FLUSH: flushes,
+            HandType.STRAIGIHT: straights,
+            HandType.THREE_OF_A_KIND: trips,
+            HandType.STRAIGHT_FLUSH: straight_flushes,
+        }
+
+    def pair_plus_ev(self, rules=STANDARD_RULES) -> float:
+        """Gets the expected net return of a pair plus bet on the next hand dealt from the cards
+        left, per unit bet.
+        Args:
+            rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+        Returns:
+            float: expected return, negative when the bet favours the house.
+        """
+        counts = self.hand_type_counts()
+        total = sum(counts.values())
+        return sum(n * rules.pair_plus_returns[t.value] for t, n in counts.items()) / total - 1
+
+    def __len__(self) -> int:
+        """Number of cards left to be dealt before the shoe needs cards back."""
+        return self.remaining
+
+class MultiDeckShoe(Shoe):
+    """This class represents a shoe of several decks shuffled together and dealt down to a cut card.
+    Once a round has dealt past the cut card, the shoe is shuffled again before the next round."""
+    def __init__(self, decks=6, penetration=0.75, rng=None):
+        """Constructs and shuffles the shoe.
+        Args:
+            decks (int): number of 52 card decks. Defaults to 6.
+            penetration (float): share of the shoe dealt before the cut card. Defaults to 0.75.
+            rng (random.Random): random number generator the shoe shuffles with. Defaults to the
+            global one in the random module.
+        """
+        super().__init__(decks=decks, rng=rng)
+        self.cut = int(penetration * self.size)
+        self.cards = list(Card.ALL) * decks
+        self.dealt = 0
+        self.shuffle()
+
+    def shuffle(self):
+        """Gathers every card and shuffles the shoe."""
+        for card in self.cards[:self.dealt]:
+            self._put(card)
+        self.dealt = 0
+        self.rng.shuffle(self.cards)
+
+    def get_n_cards(self, n):
+        """Deals the next 'n' cards of the shoe.
+        Args:
+            n (int): number of cards.
+        Raises:
+            ValueError: if fewer than 'n' cards remain in the shoe.
+        Returns:
+            tuple: 'n' amount of cards in a tuple.
+        """
+        start = self.dealt
+        end = start + n
+        if end > self.size:
+            raise ValueError('Not enough cards remaining in the shoe')
+        cards = tuple(self.cards[start:end])
+        for card in cards:
+            self._take(card)
+        self.dealt = end
+        return cards
+
+    def reset(self, seed=None):
+        """Ends a round, shuffling the shoe if the cut card has come out.
+        Args:
+            seed (int): if given, reseeds the shoe's own generator for its next shuffle. Defaults to None.
+        """
+        self._reseed(seed)
+        if self.dealt >= self.cut:
+            self.shuffle()
+
+class ContinuousShuffler(Shoe):
+    """This class represents a continuous shuffling machine. Cards are dealt from a buffer the
+    machine keeps filled with cards drawn at random from its pool, and each round's cards go back
+    into the pool when the round ends, so a card only comes around again once the buffer ahead of
+    it has been dealt."""
+    def __init__(self, decks=4, buffer=20, rng=None):
+        """Constructs the machine with every card in its pool and a filled buffer.
+        Args:
+            decks (int): number of 52 card decks. Defaults to 4.
+            buffer (int): cards held ready in the buffer. Defaults to 20.
+            rng (random.Random): random number generator the machine shuffles with. Defaults to
+            the global one in the random module.
+        """
+        super().__init__(decks=decks, rng=rng)
+        self.pool = list(Card.ALL) * decks
+        self.buffer = deque()
+        self.discards = []
+        for _ in range(buffer):
+            self.buffer.append(self._draw())
+
+    def _draw(self):
+        """Takes a card at random from the pool."""
+        pool = self.pool
+        i = int(self.rng.random() * len(pool))
+        pool[i], pool[-1] = pool[-1], pool[i]
+        return pool.pop()
+
+    def get_n_cards(self, n):
+        """Deals 'n' cards from the buffer, refilling it from the pool.
+        Args:
+            n (int): number of cards.
+        Raises:
+            ValueError: if fewer than 'n' cards remain in the machine.
+        Returns:
+            tuple: 'n' amount of cards in a tuple.
+        """
+        if n > self.remaining:
+            raise ValueError('Not enough cards remaining in the shuffler')
+        buffer = self.buffer
+        cards = []
+        for _ in range(n):
+            if self.pool:
+                buffer.append(self._draw())
+            card = buffer.popleft()
+            self._take(card)
+            cards.append(card)
+        self.discards.extend(cards)
+        return tuple(cards)
+
+    def reset(self, seed=None):
+        """Ends a round, returning its cards to the pool.
+        Args:
+            seed (int): if given, reseeds the machine's own generator. Defaults to None.
+        """
+        self._reseed(seed)
+        for card in self.discards:
+            self._put(card)
+        self.pool.extend(self.discards)
+        self.discards.clear()
@@ -0,0 +1,45 @@
+from model.model import Model
+from model.rules import STANDARD_RULES
+
+def new_table(rules=STANDARD_RULES) -> Model:
+    """Creates an independent table, a Model with its own user, dealer and deck.
+    Args:
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+    Returns:
+        Model: the new table.
+    """
+    return Model(rules=rules)
+
+class TablePool:
+    """This class represents a pool of tables that are recycled between sessions instead of being
+    built again. A released table is reset, restoring the user's money, clearing both hands and
+    returning every card to its deck."""
+    def __init__(self, rules=STANDARD_RULES, maxsize=None):
+        """Constructs an empty pool.
+        Args:
+            rules (Rules): rules of every table in the pool. Defaults to STANDARD_RULES.
+            maxsize (int): most idle tables kept, None for no limit. Defaults to None.
+        """
+        self.rules = rules
+        self.maxsize = maxsize
+        self.idle = []
+
+    def acquire(self) -> Model:
+        """Gets an idle table, or a new one if none is idle.
+        Returns:
+            Model: a table ready for a new session.
+        """
+        return self.idle.pop() if self.idle else new_table(self.rules)
+
+    def release(self, model):
+        """Resets a table and returns it to the pool, dropping it if the pool is full.
+        Args:
+            model (Model): table acquired from this pool.
+        """
+        model.reset()
+        if self.maxsize is None or len(self.idle) < self.maxsize:
+            self.idle.append(model)
+
+    def __len__(self) -> int:
+        """Number of idle tables in the pool."""
+        return len(self.idle)
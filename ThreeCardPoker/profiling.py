@@ -0,0 +1,146 @@
+"""Opt-in timing of the stages of a round.
+
+Nothing is wrapped until enable() is called, so a disabled build runs the original methods.
+Set THREE_CARD_POKER_PROFILE to a file path before running main.py to enable it; the
+histograms are written there on exit, as Prometheus text if the path ends in '.prom' and as
+JSON otherwise.
+"""
+import atexit
+import functools
+import importlib
+import os
+from time import perf_counter_ns
+
+ENV_VAR = 'THREE_CARD_POKER_PROFILE'
+
+# (module, class, methods) wrapped by enable()
+TARGETS = [
+    ('model.deck', 'Deck', ('get_n_cards', 'reset')),
+    ('model.player', 'Player', ('evaluate_hand', 'hand_rank')),
+    ('model.model', 'Model', ('deal_hands', 'compare_hands', 'get_pair_plus', 'settle_round')),
+    ('view.view', 'View', ('menu', 'preBet', 'bet', 'postBet', 'gameOver')),
+]
+
+class Histogram:
+    """This class represents the latency histogram of one stage, in power of two nanosecond
+    buckets, so recording a sample is a bit_length and a list increment."""
+    BUCKETS = 48
+
+    def __init__(self):
+        """Constructs an empty histogram."""
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, ns):
+        """Adds a sample.
+        Args:
+            ns (int): duration in nanoseconds.
+        """
+        self.counts[min(ns.bit_length(), self.BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def quantile(self, q) -> int:
+        """Gets the upper bound of the bucket holding a quantile.
+        Args:
+            q (float): quantile between 0 and 1.
+        Returns:
+            int: nanoseconds, 0 if the histogram is empty.
+        """
+        target = q * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= target:
+                return min(1 << bucket, self.max)
+        return 0
+
+    def to_dict(self) -> dict:
+        """Summarizes the histogram for JSON output."""
+        return {
+            'count': self.count,
+            'total_ns': self.total,
+            'mean_ns': self.total / self.count if self.count else 0,
+            'p50_ns': self.quantile(0.5),
+            'p99_ns': self.quantile(0.99),
+            'max_ns': self.max,
+            'buckets': {f'le_{1 << bucket}ns': count for bucket, count in enumerate(self.counts) if count},
+        }
+
+histograms = {}
+_originals = []
+
+def _timed(name, func):
+    """Wraps a function to record its duration in the histogram of 'name'."""
+    record = histograms.setdefault(name, Histogram()).record
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(perf_counter_ns() - start)
+    return wrapper
+
+def enable(targets=TARGETS):
+    """Wraps the methods of every target that can be imported. Targets whose module fails to
+    import, such as the view without PySimpleGUI, are skipped.
+    Args:
+        targets (list): (module, class, methods) to be wrapped. Defaults to TARGETS.
+    """
+    if _originals:
+        return
+    for module_name, class_name, methods in targets:
+        try:
+            cls = getattr(importlib.import_module(module_name), class_name)
+        except ImportError:
+            continue
+        for method in methods:
+            func = cls.__dict__[method]
+            _originals.append((cls, method, func))
+            setattr(cls, method, _timed(f'{class_name}.{method}', func))
+
+def disable():
+    """Restores every wrapped method."""
+    while _originals:
+        cls, method, func = _originals.pop()
+        setattr(cls, method, func)
+
+def to_json() -> str:
+    """Formats the histograms as JSON."""
+    import json
+    return json.dumps({name: histogram.to_dict() for name, histogram in histograms.items()}, indent=2)
+
+def to_prometheus() -> str:
+    """Formats the histograms in the Prometheus text exposition format, in seconds."""
+    lines = ['# TYPE three_card_poker_stage_seconds histogram']
+    for name, histogram in histograms.items():
+        seen = 0
+        for bucket, count in enumerate(histogram.counts):
+            seen += count
+            if count:
+                lines.append(f'three_card_poker_stage_seconds_bucket{{stage="{name}",le="{(1 << bucket) / 1e9:.9g}"}} {seen}')
+        lines.append(f'three_card_poker_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {histogram.count}')
+        lines.append(f'three_card_poker_stage_seconds_sum{{stage="{name}"}} {histogram.total / 1e9:.9g}')
+        lines.append(f'three_card_poker_stage_seconds_count{{stage="{name}"}} {histogram.count}')
+    return '\n'.join(lines) + '\n'
+
+def dump(path):
+    """Writes the histograms to a file.
+    Args:
+        path (str): output file, Prometheus text if it ends in '.prom' and JSON otherwise.
+    """
+    with open(path, 'w') as file:
+        file.write(to_prometheus() if path.endswith('.prom') else to_json())
+
+def enable_from_env():
+    """Enables profiling and dumps the histograms on exit when THREE_CARD_POKER_PROFILE is set."""
+    path = os.environ.get(ENV_VAR)
+    if path:
+        enable()
+        atexit.register(dump, path)
@@ -0,0 +1,41 @@
+"""Runs the table service.
+
+Run from the ThreeCardPoker directory:
+    python -m server --port 8765
+"""
+import asyncio
+from argparse import ArgumentParser
+
+from history import HistoryWriter
+from model.rules import STANDARD_RULES, load_rules
+from server.table import TableServer
+
+async def serve(host, port, rules, history=None):
+    """Serves until cancelled."""
+    table_server = TableServer(rules, history)
+    server = await table_server.start(host, port)
+    print(f'Serving tables on {", ".join(str(sock.getsockname()) for sock in server.sockets)}')
+    async with server:
+        await server.serve_forever()
+
+def main(argv=None):
+    """Parses the command line and runs the service."""
+    parser = ArgumentParser(prog='python -m server', description='Host Three Card Poker tables over JSON lines.')
+    parser.add_argument('--host', default='127.0.0.1', help='address to bind')
+    parser.add_argument('--port', type=int, default=8765, help='port to bind')
+    parser.add_argument('--rules', help='JSON file of table rules, defaults to the standard rules')
+    parser.add_argument('--history', help='hand history file every settled round is appended to')
+    args = parser.parse_args(argv)
+
+    rules = load_rules(args.rules) if args.rules else STANDARD_RULES
+    history = HistoryWriter(args.history) if args.history else None
+    try:
+        asyncio.run(serve(args.host, args.port, rules, history))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if history is not None:
+            history.close()
+
+if __name__ == '__main__':
+    main()
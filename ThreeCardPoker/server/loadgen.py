@@ -0,0 +1,88 @@
+"""Load generator for the table service: many concurrent sessions each playing rounds with the
+queen, six, four strategy, reporting throughput and round latency.
+
+Run from the ThreeCardPoker directory, against a running service or one started in-process:
+    python -m server.loadgen --sessions 500 --rounds 100 --local
+"""
+import asyncio
+import json
+from argparse import ArgumentParser
+from time import perf_counter
+
+from model.hand_rank import HAND_RANKS
+from server.table import TableServer
+from sim.strategies import Q64_RANK
+
+async def request(reader, writer, message) -> dict:
+    """Sends one request and waits for its response."""
+    writer.write(json.dumps(message).encode() + b'\n')
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+async def run_session(host, port, rounds, pair_plus, latencies):
+    """Plays rounds on one connection, appending each round's latency in seconds.
+    Returns:
+        int: rounds completed.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    completed = 0
+    try:
+        for _ in range(rounds):
+            start = perf_counter()
+            dealt = await request(reader, writer, {'op': 'deal', 'pair_plus': pair_plus})
+            if not dealt['ok']:
+                await request(reader, writer, {'op': 'rebuy'})
+                continue
+            a, b, c = dealt['hand']
+            op = 'play' if HAND_RANKS[1 << a | 1 << b | 1 << c] >= Q64_RANK else 'fold'
+            await request(reader, writer, {'op': op})
+            latencies.append(perf_counter() - start)
+            completed += 1
+    finally:
+        writer.close()
+    return completed
+
+def percentile(samples, q) -> float:
+    """Gets a percentile of sorted samples by nearest rank."""
+    return samples[min(len(samples) - 1, int(q * len(samples)))] if samples else 0.0
+
+async def run(host, port, sessions, rounds, pair_plus, local):
+    """Runs every session concurrently and prints the report."""
+    table_server = server = None
+    if local:
+        table_server = TableServer()
+        server = await table_server.start(host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    latencies = []
+    start = perf_counter()
+    completed = await asyncio.gather(*(run_session(host, port, rounds, pair_plus, latencies) for _ in range(sessions)))
+    elapsed = perf_counter() - start
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+    latencies.sort()
+    total = sum(completed)
+    print(f'Sessions:          {sessions}')
+    if table_server is not None:
+        print(f'Peak sessions:     {table_server.peak_sessions}')
+    print(f'Rounds:            {total}')
+    print(f'Rounds per second: {total / elapsed:,.0f}')
+    print(f'Round latency p50: {percentile(latencies, 0.5) * 1e3:.2f} ms')
+    print(f'Round latency p99: {percentile(latencies, 0.99) * 1e3:.2f} ms')
+
+def main(argv=None):
+    """Parses the command line and runs the load test."""
+    parser = ArgumentParser(prog='python -m server.loadgen', description='Load test the table service.')
+    parser.add_argument('--host', default='127.0.0.1', help='address of the service')
+    parser.add_argument('--port', type=int, default=8765, help='port of the service')
+    parser.add_argument('--sessions', type=int, default=200, help='concurrent sessions')
+    parser.add_argument('--rounds', type=int, default=100, help='rounds per session')
+    parser.add_argument('--pair-plus', type=int, default=1000, help='pair plus bet each round, in cents')
+    parser.add_argument('--local', action='store_true', help='start the service in this process')
+    args = parser.parse_args(argv)
+    asyncio.run(run(args.host, args.port, args.sessions, args.rounds, args.pair_plus, args.local))
+
+if __name__ == '__main__':
+    main()
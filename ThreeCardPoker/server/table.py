@@ -0,0 +1,185 @@
+"""Table service hosting many independent tables in one asyncio process.
+
+Each connection is a session with its own Model, User, Dealer and Deck, speaking JSON lines:
+one request object per line in, one response object per line out. Amounts are whole cents.
+
+Requests:
+    {"op": "deal", "pair_plus": 1000} antes, places the optional pair plus bet and deals
+    {"op": "play", "wager": 2500}     places the play wager (defaults to the ante) and settles
+    {"op": "fold"}                    folds and settles
+    {"op": "balance"}                 gets the user's money
+    {"op": "rebuy"}                   restores the user's initial money
+    {"op": "stats"}                   gets the bankroll analytics of the session
+Every response has "ok"; failed requests carry "error" instead of a result.
+"""
+import asyncio
+import json
+
+from model.deck import new_seed
+from model.rules import STANDARD_RULES
+from model.table import TablePool
+from sim.bankroll import BankrollTracker
+
+def card_names(hand) -> list:
+    """Gets short names of cards, such as '14S' for the ace of spades."""
+    return [str(card.card_value) + card.card_suit.name[0] for card in hand]
+
+class TableSession:
+    """This class represents one table: a Model and the stage of its current round."""
+    def __init__(self, model, history=None):
+        """Constructs a session at a table.
+        Args:
+            model (Model): table with its own user, dealer and deck, from TablePool.acquire().
+            history (HistoryWriter): hand history settled rounds are appended to. Defaults to None.
+        """
+        self.model = model
+        self.history = history
+        self.tracker = BankrollTracker(initial=model.user.INITIAL_MONEY, ante=model.rules.ante)
+        self.dealt = False
+        self.ops = {
+            'deal': self.deal,
+            'play': self.play,
+            'fold': self.fold,
+            'balance': self.balance,
+            'rebuy': self.rebuy,
+            'stats': self.stats,
+        }
+
+    def handle(self, request) -> dict:
+        """Handles one request.
+        Args:
+            request (dict): decoded request.
+        Returns:
+            dict: response.
+        """
+        if not isinstance(request, dict):
+            return {'ok': False, 'error': 'Request must be an object'}
+        op = self.ops.get(request.get('op'))
+        if op is None:
+            return {'ok': False, 'error': f'Unknown op: {request.get("op")}'}
+        try:
+            return op(request)
+        except (ValueError, TypeError) as error:
+            return {'ok': False, 'error': str(error)}
+
+    def deal(self, request) -> dict:
+        """Starts a round: antes, places the pair plus bet and deals. Both bets are checked before
+        either is taken, so a rejected request costs the user nothing."""
+        if self.dealt:
+            raise ValueError('Round already dealt')
+        model = self.model
+        pair_plus = request.get('pair_plus', 0)
+        if not isinstance(pair_plus, int) or isinstance(pair_plus, bool):
+            raise TypeError('amount must be whole cents')
+        if pair_plus:
+            model.rules.check_bet(pair_plus)
+        if model.rules.ante + pair_plus > model.user.money:
+            raise ValueError('Invalid Bet: Insufficient Funds')
+        model.new_round(seed=new_seed() if self.history is not None else None)
+        model.place_ante()
+        model.place_pair_plus(amount=pair_plus)
+        model.deal_hands()
+        self.dealt = True
+        return {'ok': True, 'hand': [card.code for card in model.user.hand],
+                'cards': card_names(model.user.hand), 'money': model.user.money}
+
+    def _settle(self) -> dict:
+        """Settles the round and reports the dealer's hand and the result."""
+        model = self.model
+        model.settle_round()
+        model.dealer.reveal_hand()
+        self.tracker.add(model.net)
+        if self.history is not None:
+            self.history.record(model)
+        self.dealt = False
+        return {'ok': True, 'dealer': [card.code for card in model.dealer.hand],
+                'dealer_cards': card_names(model.dealer.hand), 'net': model.net,
+                'payout': model.payout, 'money': model.user.money}
+
+    def play(self, request) -> dict:
+        """Places the play wager and settles the round."""
+        if not self.dealt:
+            raise ValueError('No round dealt')
+        self.model.place_play(amount=request.get('wager', self.model.rules.ante))
+        self.model.compare_hands()
+        return self._settle()
+
+    def fold(self, request) -> dict:
+        """Folds and settles the round."""
+        if not self.dealt:
+            raise ValueError('No round dealt')
+        self.model.fold()
+        return self._settle()
+
+    def balance(self, request) -> dict:
+        """Reports the user's money."""
+        return {'ok': True, 'money': self.model.user.money}
+
+    def rebuy(self, request) -> dict:
+        """Restores the user's initial money between rounds."""
+        if self.dealt:
+            raise ValueError('Round in progress')
+        self.model.user.money = self.model.user.INITIAL_MONEY
+        return {'ok': True, 'money': self.model.user.money}
+
+    def stats(self, request) -> dict:
+        """Reports the bankroll analytics of every round settled in this session."""
+        return {'ok': True, **self.tracker.to_dict()}
+
+class TableServer:
+    """This class represents the asyncio service, one TableSession per connection. Hands are
+    evaluated inline on the event loop since a lookup costs far less than a network round trip."""
+    def __init__(self, rules=STANDARD_RULES, history=None):
+        """Constructs the service.
+        Args:
+            rules (Rules): rules of every table. Defaults to STANDARD_RULES.
+            history (HistoryWriter): hand history every table appends to. Defaults to None.
+        """
+        self.rules = rules
+        self.history = history
+        self.pool = TablePool(rules)
+        self.sessions = 0
+        self.peak_sessions = 0
+        self.rounds = 0
+
+    async def handle_connection(self, reader, writer):
+        """Serves one session until the client disconnects."""
+        session = TableSession(self.pool.acquire(), self.history)
+        self.sessions += 1
+        self.peak_sessions = max(self.peak_sessions, self.sessions)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # A line over the stream limit, whose rest could not be told apart from the next request
+                    writer.write(json.dumps({'ok': False, 'error': 'Request too long'}).encode() + b'\n')
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                try:
+                    response = session.handle(json.loads(line))
+                except ValueError:
+                    # JSONDecodeError and UnicodeDecodeError
+                    response = {'ok': False, 'error': 'Invalid JSON'}
+                if 'net' in response:
+                    self.rounds += 1
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions -= 1
+            self.pool.release(session.model)
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=8765):
+        """Starts listening.
+        Args:
+            host (str): address to bind. Defaults to '127.0.0.1'.
+            port (int): port to bind, 0 for any free port. Defaults to 8765.
+        Returns:
+            asyncio.Server: the listening server.
+        """
+        return await asyncio.start_server(self.handle_connection, host, port, backlog=4096)
@@ -0,0 +1,54 @@
+"""Headless simulation of the game.
+
+Run from the ThreeCardPoker directory:
+    python -m sim --rounds 1000000 --strategy q64
+    python -m sim --rounds 100000000 --workers 8 --seed 42
+    python -m sim --rounds 100000000 --vectorized
+    python -m sim --rounds 1000000 --bankroll
+    python -m sim --rounds 1000000 --seats 6
+"""
+from argparse import ArgumentParser
+
+from model.rules import STANDARD_RULES, load_rules
+from sim.bankroll import BankrollTracker
+from sim.engine import simulate, simulate_table
+from sim.parallel import SHARD_SIZE, simulate_parallel
+from sim.strategies import STRATEGIES, strategies_for
+
+def main(argv=None):
+    """Parses the command line, runs the simulation and prints the report."""
+    parser = ArgumentParser(prog='python -m sim', description='Simulate rounds of Three Card Poker without a view.')
+    parser.add_argument('--rounds', type=int, default=1_000_000, help='number of rounds to play')
+    parser.add_argument('--strategy', choices=sorted(STRATEGIES), default='q64', help='play/fold strategy')
+    parser.add_argument('--rules', help='JSON file of table rules, defaults to the standard rules')
+    parser.add_argument('--pair-plus', type=int, help='pair plus bet placed each round in cents, defaults to the ante')
+    parser.add_argument('--workers', type=int, help='worker processes, defaults to the number of CPUs when sharding')
+    parser.add_argument('--seed', type=int, help='seed for a reproducible run, independent of --workers')
+    parser.add_argument('--shard-size', type=int, default=SHARD_SIZE, help='rounds per seeded shard')
+    parser.add_argument('--vectorized', action='store_true', help='play the rounds in NumPy batches')
+    parser.add_argument('--seats', type=int, help='seats dealt from one deck against one dealer hand, played in one process')
+    parser.add_argument('--bankroll', action='store_true', help='also report drawdown and time to ruin, played in one process')
+    args = parser.parse_args(argv)
+
+    rules = load_rules(args.rules) if args.rules else STANDARD_RULES
+    strategy = strategies_for(rules)[args.strategy]
+    tracker = None
+    if args.seats:
+        result = simulate_table(args.rounds, seats=args.seats, strategy=strategy, rules=rules, pair_plus=args.pair_plus)
+    elif args.bankroll:
+        tracker = BankrollTracker(ante=rules.ante)
+        result = simulate(args.rounds, strategy=strategy, rules=rules, pair_plus=args.pair_plus, tracker=tracker)
+    elif args.vectorized:
+        from sim.vectorized import batch_strategies_for, simulate_batch
+        result = simulate_batch(args.rounds, strategy=batch_strategies_for(rules)[args.strategy], rules=rules, pair_plus=args.pair_plus, seed=args.seed)
+    elif args.workers is None and args.seed is None:
+        result = simulate(args.rounds, strategy=strategy, rules=rules, pair_plus=args.pair_plus)
+    else:
+        result = simulate_parallel(args.rounds, strategy=strategy, rules=rules, pair_plus=args.pair_plus,
+                                   seed=args.seed or 0, workers=args.workers, shard_size=args.shard_size)
+    print(result.report())
+    if tracker is not None:
+        print(tracker.report())
+
+if __name__ == '__main__':
+    main()
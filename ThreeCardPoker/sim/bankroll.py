@@ -0,0 +1,196 @@
+"""Streaming bankroll analytics over a sequence of round results.
+
+Every statistic is updated in constant time and memory per round, so a tracker can follow a
+simulation of any length or a live table and be queried at any point.
+"""
+from math import sqrt
+
+from model.money import CENTS, format_money
+from model.player import User
+from model.rules import STANDARD_RULES
+
+class RunningStats:
+    """This class represents the running count, mean and variance of a series, updated with
+    Welford's algorithm so no sum of squares can lose precision."""
+    def __init__(self):
+        """Constructs empty statistics."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x):
+        """Adds a value to the series."""
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def merge(self, other):
+        """Combines the statistics of another series into these ones.
+        Args:
+            other (RunningStats): statistics to be merged.
+        Returns:
+            RunningStats: these statistics.
+        """
+        count = self.count + other.count
+        if other.count:
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / count
+            self.m2 += other.m2 + delta * delta * self.count * other.count / count
+            self.count = count
+        return self
+
+    def variance(self) -> float:
+        """Gets the sample variance, 0 with fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def stdev(self) -> float:
+        """Gets the sample standard deviation."""
+        return sqrt(self.variance())
+
+class QuantileSketch:
+    """This class represents the estimate of one quantile of a series with the P-squared algorithm
+    of Jain and Chlamtac, which keeps five markers whatever the length of the series."""
+    def __init__(self, q):
+        """Constructs an empty sketch.
+        Args:
+            q (float): quantile between 0 and 1.
+        """
+        self.q = q
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5]
+        self.increments = (0, q / 2, q, (1 + q) / 2, 1)
+
+    def add(self, x):
+        """Adds a value to the series."""
+        heights, positions, desired = self.heights, self.positions, self.desired
+        if len(heights) < 5:
+            heights.append(x)
+            heights.sort()
+            return
+
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= heights[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            desired[i] += self.increments[i]
+
+        # Moves each middle marker a step towards its desired position, along a parabola through
+        # its neighbours or, if that leaves them out of order, along a line
+        for i in (1, 2, 3):
+            d = desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (d <= -1 and positions[i - 1] - positions[i] < -1):
+                d = 1 if d > 0 else -1
+                n_prev, n, n_next = positions[i - 1], positions[i], positions[i + 1]
+                h_prev, h, h_next = heights[i - 1], heights[i], heights[i + 1]
+                height = h + d / (n_next - n_prev) * ((n - n_prev + d) * (h_next - h) / (n_next - n)
+                                                      + (n_next - n - d) * (h - h_prev) / (n - n_prev))
+                if not h_prev < height < h_next:
+                    height = h + d * (heights[i + d] - h) / (positions[i + d] - n)
+                heights[i] = height
+                positions[i] = n + d
+
+    def value(self) -> float:
+        """Gets the estimated quantile, exact while fewer than five values were added.
+        Returns:
+            float: the quantile, 0 if the series is empty.
+        """
+        heights = self.heights
+        if len(heights) < 5:
+            return heights[min(len(heights) - 1, int(self.q * len(heights)))] if heights else 0.0
+        return heights[2]
+
+class BankrollTracker:
+    """This class represents the analytics of a bankroll fed one round result at a time: the
+    mean and variance of the result per round, the largest drawdown of the cumulative result, and
+    the distribution of the rounds a bankroll starting at User.INITIAL_MONEY lasts before it can
+    no longer cover the ante. A ruined bankroll starts over from User.INITIAL_MONEY."""
+    QUANTILES = (0.01, 0.5, 0.99)
+
+    def __init__(self, initial=User.INITIAL_MONEY, ante=STANDARD_RULES.ante, quantiles=QUANTILES):
+        """Constructs a tracker with no rounds.
+        Args:
+            initial (int): bankroll in cents each session starts with. Defaults to User.INITIAL_MONEY.
+            ante (int): ante of the table in cents, a bankroll below it is ruined. Defaults to the standard ante.
+            quantiles (tuple): quantiles sketched for the round result and the time to ruin.
+            Defaults to QUANTILES.
+        """
+        self.initial = initial
+        self.ante = ante
+        self.rounds = RunningStats()
+        self.round_quantiles = [QuantileSketch(q) for q in quantiles]
+        self.total = 0
+        self.peak = 0
+        self.max_drawdown = 0
+        self.bankroll = initial
+        self.session_rounds = 0
+        self.ruin = RunningStats()
+        self.ruin_quantiles = [QuantileSketch(q) for q in quantiles]
+
+    def add(self, net):
+        """Adds the net win or loss of a round.
+        Args:
+            net (int): net result of the round, in cents.
+        """
+        self.rounds.add(net)
+        for sketch in self.round_quantiles:
+            sketch.add(net)
+
+        self.total += net
+        if self.total > self.peak:
+            self.peak = self.total
+        elif self.peak - self.total > self.max_drawdown:
+            self.max_drawdown = self.peak - self.total
+
+        self.bankroll += net
+        self.session_rounds += 1
+        if self.bankroll < self.ante:
+            self.ruin.add(self.session_rounds)
+            for sketch in self.ruin_quantiles:
+                sketch.add(self.session_rounds)
+            self.bankroll = self.initial
+            self.session_rounds = 0
+
+    def ruin_rate(self) -> float:
+        """Gets the chance of ruin per round played, the ruins over the rounds."""
+        return self.ruin.count / self.rounds.count if self.rounds.count else 0.0
+
+    def to_dict(self) -> dict:
+        """Summarizes the analytics for JSON output."""
+        return {
+            'rounds': self.rounds.count,
+            'mean': self.rounds.mean,
+            'stdev': self.rounds.stdev(),
+            'total': self.total,
+            'max_drawdown': self.max_drawdown,
+            'quantiles': {str(sketch.q): sketch.value() for sketch in self.round_quantiles},
+            'ruins': self.ruin.count,
+            'rounds_to_ruin_mean': self.ruin.mean,
+            'rounds_to_ruin_quantiles': {str(sketch.q): sketch.value() for sketch in self.ruin_quantiles},
+        }
+
+    def report(self) -> str:
+        """Formats the analytics for the command line, in dollars.
+        Returns:
+            str: one statistic per line.
+        """
+        lines = [
+            f'Net per round:      {self.rounds.mean / CENTS:.4f} +/- {self.rounds.stdev() / CENTS:.4f}',
+            *(f'{f"Net p{sketch.q * 100:g}:":<20}{sketch.value() / CENTS:.2f}' for sketch in self.round_quantiles),
+            f'Max drawdown:       {format_money(self.max_drawdown)}',
+            f'Ruins:              {self.ruin.count} from {format_money(self.initial)}',
+        ]
+        if self.ruin.count:
+            lines.append(f'Rounds to ruin:     {self.ruin.mean:,.1f} mean')
+            lines.extend(f'{f"Rounds to ruin p{sketch.q * 100:g}:":<20}{sketch.value():,.0f}' for sketch in self.ruin_quantiles)
+        return '\n'.join(lines)
@@ -0,0 +1,203 @@
+from time import perf_counter
+
+from model.deck import Deck
+from model.hand_rank import HAND_RANKS, HAND_TYPE_SHIFT
+from model.rules import STANDARD_RULES
+from sim.strategies import play_q64
+
+class SimResult:
+    """This class represents the running totals of a simulation. Every amount is a net win or
+    loss for the user, so the sums stay exact integers for integer bets and two results can be
+    merged in any order."""
+    def __init__(self, ante=STANDARD_RULES.ante, pair_plus=STANDARD_RULES.ante):
+        """Constructs an empty result.
+        Args:
+            ante (int): ante placed each round. Defaults to the standard ante.
+            pair_plus (int): pair plus bet placed each round. Defaults to the standard ante.
+        """
+        self.ante = ante
+        self.pair_plus = pair_plus
+        self.rounds = 0
+        self.played = 0
+        self.wins = 0
+        self.main_sum = 0
+        self.main_sq = 0
+        self.pair_plus_sum = 0
+        self.pair_plus_sq = 0
+        self.elapsed = 0.0
+
+    def merge(self, other):
+        """Adds the totals of another result with the same bets into this one.
+        Args:
+            other (SimResult): result to be merged.
+        Returns:
+            SimResult: this result.
+        """
+        self.rounds += other.rounds
+        self.played += other.played
+        self.wins += other.wins
+        self.main_sum += other.main_sum
+        self.main_sq += other.main_sq
+        self.pair_plus_sum += other.pair_plus_sum
+        self.pair_plus_sq += other.pair_plus_sq
+        self.elapsed = max(self.elapsed, other.elapsed)
+        return self
+
+    def house_edge(self):
+        """Gets the house edge of the ante and play wager, as the average loss per ante."""
+        return -self.main_sum / (self.rounds * self.ante)
+
+    def pair_plus_return(self):
+        """Gets the average return of the pair plus bet per unit bet."""
+        return self.pair_plus_sum / (self.rounds * self.pair_plus) if self.pair_plus else 0.0
+
+    def main_variance(self):
+        """Gets the variance of the ante and play wager result per round, in antes squared."""
+        mean = self.main_sum / self.rounds
+        return (self.main_sq / self.rounds - mean * mean) / (self.ante * self.ante)
+
+    def pair_plus_variance(self):
+        """Gets the variance of the pair plus result per round, in units bet squared."""
+        if not self.pair_plus:
+            return 0.0
+        mean = self.pair_plus_sum / self.rounds
+        return (self.pair_plus_sq / self.rounds - mean * mean) / (self.pair_plus * self.pair_plus)
+
+    def rounds_per_second(self):
+        """Gets the simulation throughput."""
+        return self.rounds / self.elapsed if self.elapsed else 0.0
+
+    def report(self) -> str:
+        """Formats the result for the command line.
+        Returns:
+            str: one statistic per line.
+        """
+        return '\n'.join([
+            f'Rounds:             {self.rounds}',
+            f'Played:             {self.played / self.rounds:.4%}',
+            f'Won:                {self.wins / self.rounds:.4%}',
+            f'House edge:         {self.house_edge():.4%} of ante',
+            f'Variance:           {self.main_variance():.4f} antes^2',
+            f'Pair plus return:   {self.pair_plus_return():.4%}',
+            f'Pair plus variance: {self.pair_plus_variance():.4f} units^2',
+            f'Rounds per second:  {self.rounds_per_second():,.0f}',
+        ])
+
+def simulate(rounds, strategy=play_q64, rules=STANDARD_RULES, pair_plus=None, deck=None, tracker=None):
+    """Plays rounds of ante, pair plus, play/fold and hand comparison against the dealer without
+    a view, settling them under the given rules the way Model does. The play wager equals the ante.
+    Args:
+        rounds (int): number of rounds to be played.
+        strategy (function): takes the user's hand and its rank and returns True to play or
+        False to fold. Defaults to play_q64.
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+        pair_plus (int): pair plus bet placed each round. Defaults to the ante of the rules.
+        deck (Deck): deck to deal from. Defaults to a new Deck().
+        tracker (BankrollTracker): bankroll analytics fed the net result of every round. Defaults to None.
+    Returns:
+        SimResult: totals of the rounds played.
+    """
+    deck = Deck() if deck is None else deck
+    ante = rules.ante
+    pair_plus = ante if pair_plus is None else pair_plus
+    result = SimResult(ante=ante, pair_plus=pair_plus)
+    reset = deck.reset
+    deal = deck.get_n_cards
+    ranks = HAND_RANKS
+    pair_plus_returns = rules.pair_plus_returns
+    settle = rules.settle
+    track = tracker.add if tracker is not None else None
+    played = wins = main_sum = main_sq = pair_plus_sum = pair_plus_sq = 0
+
+    start = perf_counter()
+    for _ in range(rounds):
+        reset()
+        a, b, c, d, e, f = deal(6)
+        user_rank = ranks[a.mask | b.mask | c.mask]
+
+        pair_plus_net = pair_plus * pair_plus_returns[user_rank >> HAND_TYPE_SHIFT] - pair_plus
+        pair_plus_sum += pair_plus_net
+        pair_plus_sq += pair_plus_net * pair_plus_net
+
+        if strategy((a, b, c), user_rank):
+            played += 1
+            dealer_rank = ranks[d.mask | e.mask | f.mask]
+            wins += user_rank > dealer_rank
+            net = settle(user_rank, dealer_rank, ante, ante) - 2 * ante
+        else:
+            net = -ante
+        main_sum += net
+        main_sq += net * net
+        if track is not None:
+            track(net + pair_plus_net)
+
+    result.elapsed = perf_counter() - start
+    result.rounds = rounds
+    result.played = played
+    result.wins = wins
+    result.main_sum = main_sum
+    result.main_sq = main_sq
+    result.pair_plus_sum = pair_plus_sum
+    result.pair_plus_sq = pair_plus_sq
+    return result
+
+def simulate_table(rounds, seats=6, strategy=play_q64, rules=STANDARD_RULES, pair_plus=None, deck=None):
+    """Plays rounds of a full table, every seat dealt from the same deck against one dealer hand,
+    so the cards the other seats hold are out of play the way they are at a real table. The
+    dealer's hand is ranked once a round. Every seat plays the same strategy with the play
+    wager equal to the ante.
+    Args:
+        rounds (int): number of rounds to be played.
+        seats (int): seats at the table, up to MultiSeatModel.MAX_SEATS. Defaults to 6.
+        strategy (function): takes a seat's hand and its rank and returns True to play or
+        False to fold. Defaults to play_q64.
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+        pair_plus (int): pair plus bet placed by every seat each round. Defaults to the ante of the rules.
+        deck (Deck): deck to deal from. Defaults to a new Deck().
+    Returns:
+        SimResult: totals over every seat, counting each seat's round as a round.
+    """
+    deck = Deck() if deck is None else deck
+    ante = rules.ante
+    pair_plus = ante if pair_plus is None else pair_plus
+    result = SimResult(ante=ante, pair_plus=pair_plus)
+    reset = deck.reset
+    deal = deck.get_n_cards
+    ranks = HAND_RANKS
+    pair_plus_returns = rules.pair_plus_returns
+    settle = rules.settle
+    n = 3 * seats
+    played = wins = main_sum = main_sq = pair_plus_sum = pair_plus_sq = 0
+
+    start = perf_counter()
+    for _ in range(rounds):
+        reset()
+        cards = deal(n + 3)
+        d, e, f = cards[n:]
+        dealer_rank = ranks[d.mask | e.mask | f.mask]
+        for i in range(0, n, 3):
+            a, b, c = hand = cards[i:i + 3]
+            user_rank = ranks[a.mask | b.mask | c.mask]
+
+            net = pair_plus * pair_plus_returns[user_rank >> HAND_TYPE_SHIFT] - pair_plus
+            pair_plus_sum += net
+            pair_plus_sq += net * net
+
+            if strategy(hand, user_rank):
+                played += 1
+                wins += user_rank > dealer_rank
+                net = settle(user_rank, dealer_rank, ante, ante) - 2 * ante
+            else:
+                net = -ante
+            main_sum += net
+            main_sq += net * net
+
+    result.elapsed = perf_counter() - start
+    result.rounds = rounds * seats
+    result.played = played
+    result.wins = wins
+    result.main_sum = main_sum
+    result.main_sq = main_sq
+    result.pair_plus_sum = pair_plus_sum
+    result.pair_plus_sq = pair_plus_sq
+    return result
@@ -0,0 +1,203 @@
+"""Exact analysis of the game by enumerating every deal instead of sampling.
+
+Run from the ThreeCardPoker directory:
+    python -m sim.exact --csv ev_table.csv
+"""
+from argparse import ArgumentParser
+from bisect import bisect_left, bisect_right
+from fractions import Fraction
+from itertools import combinations, permutations
+from time import perf_counter
+
+from model.deck import Deck
+from model.hand_rank import HAND_RANKS, HAND_TYPES, HAND_TYPE_SHIFT
+from model.rules import STANDARD_RULES, load_rules
+
+# Dealer hands left once the user holds three cards: C(49, 3)
+DEALER_HANDS = 18424
+
+_SUIT_PERMUTATIONS = tuple(permutations(range(4)))
+
+def canonical(codes) -> tuple:
+    """Gets the canonical form of a hand under suit isomorphism, the smallest sorted code tuple
+    over every relabelling of the four suits. Hands with the same form have the same odds.
+    Args:
+        codes (iterable): card codes of the hand.
+    Returns:
+        tuple: sorted card codes of the canonical hand.
+    """
+    return min(tuple(sorted(code & ~3 | perm[code & 3] for code in codes)) for perm in _SUIT_PERMUTATIONS)
+
+class RankCounts:
+    """This class represents the ranks of all 22,100 hands sorted for counting, along with the
+    ranks of the hands holding each card and each pair of cards. Counting by inclusion-exclusion
+    over these gives the number of dealer hands below a rank that share no card with the user."""
+    def __init__(self):
+        """Constructs the sorted rank lists from the HAND_RANKS lookup table."""
+        self.all = []
+        self.by_card = [[] for _ in range(Deck.SIZE)]
+        self.by_pair = {}
+        for hand in combinations(range(Deck.SIZE), 3):
+            rank = HAND_RANKS[1 << hand[0] | 1 << hand[1] | 1 << hand[2]]
+            self.all.append(rank)
+            for code in hand:
+                self.by_card[code].append(rank)
+            for pair in combinations(hand, 2):
+                self.by_pair.setdefault(pair, []).append(rank)
+        self.all.sort()
+        for ranks in self.by_card:
+            ranks.sort()
+        for ranks in self.by_pair.values():
+            ranks.sort()
+
+    def _count(self, codes, rank, search) -> int:
+        """Counts the hands sharing no card with 'codes' that 'search' places before 'rank'."""
+        a, b, c = sorted(codes)
+        by_card, by_pair = self.by_card, self.by_pair
+        own = HAND_RANKS[1 << a | 1 << b | 1 << c]
+        return (search(self.all, rank)
+                - search(by_card[a], rank) - search(by_card[b], rank) - search(by_card[c], rank)
+                + search(by_pair[a, b], rank) + search(by_pair[a, c], rank) + search(by_pair[b, c], rank)
+                - search((own,), rank))
+
+    def below(self, codes, rank) -> int:
+        """Counts the dealer hands ranked below 'rank' that share no card with 'codes'.
+        Args:
+            codes (tuple): the user's three card codes.
+            rank (int): rank to count below.
+        Returns:
+            int: number of dealer hands.
+        """
+        return self._count(codes, rank, bisect_left)
+
+    def at_or_below(self, codes, rank) -> int:
+        """Counts the dealer hands ranked at or below 'rank' that share no card with 'codes'.
+        Args:
+            codes (tuple): the user's three card codes.
+            rank (int): rank to count up to.
+        Returns:
+            int: number of dealer hands.
+        """
+        return self._count(codes, rank, bisect_right)
+
+class HandClass:
+    """This class represents the exact outcome of one suit-isomorphic class of user hands played
+    against every dealer hand, counted in dealer hands out of DEALER_HANDS."""
+    def __init__(self, codes, count, unqualified, wins, ties, losses, rules=STANDARD_RULES):
+        """Constructs a hand class and its expected values in antes, settled the way Rules.settle
+        and Rules.pair_plus_payout settle a round with the play wager equal to the ante.
+        Args:
+            codes (tuple): canonical card codes of the class.
+            count (int): number of user hands in the class.
+            unqualified (int): dealer hands that do not qualify.
+            wins (int): qualifying dealer hands the user beats.
+            ties (int): qualifying dealer hands the user ties.
+            losses (int): qualifying dealer hands that beat the user.
+            rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+        """
+        self.codes = codes
+        self.count = count
+        self.rank = HAND_RANKS[1 << codes[0] | 1 << codes[1] | 1 << codes[2]]
+        self.unqualified = unqualified
+        self.wins = wins
+        self.ties = ties
+        self.losses = losses
+        hand_type = self.rank >> HAND_TYPE_SHIFT
+        self.play_ev = rules.ante_bonus_odds[hand_type] + Fraction(
+            unqualified * rules.ante_pays + wins * (rules.ante_pays + rules.play_pays) - 2 * losses, DEALER_HANDS)
+        self.fold_ev = Fraction(-1)
+        self.pair_plus_ev = Fraction(rules.pair_plus_returns[hand_type] - 1)
+
+    def play(self) -> bool:
+        """Gets the EV-maximizing decision, playing when it is no worse than folding."""
+        return self.play_ev >= self.fold_ev
+
+    def best_ev(self) -> Fraction:
+        """Gets the expected value of the ante and play wager under the best decision."""
+        return max(self.play_ev, self.fold_ev)
+
+def analyze(rules=STANDARD_RULES, counts=None) -> list:
+    """Enumerates every user hand, grouped into suit-isomorphic classes, against every dealer hand.
+    Args:
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+        counts (RankCounts): sorted rank lists to count with. Defaults to building new ones.
+    Returns:
+        list: HandClass of every class, best hand first.
+    """
+    counts = RankCounts() if counts is None else counts
+    sizes = {}
+    for hand in combinations(range(Deck.SIZE), 3):
+        key = canonical(hand)
+        sizes[key] = sizes.get(key, 0) + 1
+
+    classes = []
+    for codes, count in sizes.items():
+        rank = HAND_RANKS[1 << codes[0] | 1 << codes[1] | 1 << codes[2]]
+        unqualified = counts.below(codes, rules.qualifier_rank)
+        below = counts.below(codes, rank)
+        at_or_below = counts.at_or_below(codes, rank)
+        # Unqualified dealer hands all rank below a user hand that qualifies and none tie it
+        wins = max(0, below - unqualified)
+        ties = at_or_below - below if rank >= rules.qualifier_rank else 0
+        classes.append(HandClass(codes, count, unqualified, wins, ties, DEALER_HANDS - unqualified - wins - ties, rules))
+    classes.sort(key=lambda hand_class: (hand_class.rank, hand_class.codes), reverse=True)
+    return classes
+
+def house_edge(classes, strategy=None) -> Fraction:
+    """Gets the exact house edge of the ante and play wager, as the average loss per ante.
+    Args:
+        classes (list): HandClass of every class, from analyze().
+        strategy (function): takes a hand and its rank and returns True to play. Defaults to
+        None, the EV-maximizing decision.
+    Returns:
+        Fraction: house edge.
+    """
+    total = 0
+    for hand_class in classes:
+        if strategy is None:
+            ev = hand_class.best_ev()
+        else:
+            ev = hand_class.play_ev if strategy(hand_class.codes, hand_class.rank) else hand_class.fold_ev
+        total += hand_class.count * ev
+    return -total / sum(hand_class.count for hand_class in classes)
+
+def pair_plus_return(classes) -> Fraction:
+    """Gets the exact return of the pair plus bet per unit bet."""
+    return sum(hand_class.count * hand_class.pair_plus_ev for hand_class in classes) / sum(hand_class.count for hand_class in classes)
+
+def write_csv(classes, path):
+    """Writes the per-hand EV table, one row per class.
+    Args:
+        classes (list): HandClass of every class, from analyze().
+        path (str): file to be written.
+    """
+    with open(path, 'w') as file:
+        file.write('hand,hand_type,rank,count,dealer_unqualified,win,tie,lose,play_ev,fold_ev,decision,pair_plus_ev\n')
+        for c in classes:
+            hand = ' '.join(f'{(code >> 2) + 2}{"SHDC"[code & 3]}' for code in c.codes)
+            file.write(f'{hand},{HAND_TYPES[c.rank >> HAND_TYPE_SHIFT].name},{c.rank},{c.count},'
+                       f'{c.unqualified / DEALER_HANDS:.6f},{c.wins / DEALER_HANDS:.6f},{c.ties / DEALER_HANDS:.6f},{c.losses / DEALER_HANDS:.6f},'
+                       f'{float(c.play_ev):.6f},{float(c.fold_ev):.6f},{"play" if c.play() else "fold"},'
+                       f'{float(c.pair_plus_ev):.6f}\n')
+
+def main(argv=None):
+    """Parses the command line, runs the analysis and prints the exact results."""
+    parser = ArgumentParser(prog='python -m sim.exact', description='Exact analysis of Three Card Poker.')
+    parser.add_argument('--csv', help='write the per-hand EV table to this file')
+    parser.add_argument('--rules', help='JSON file of table rules, defaults to the standard rules')
+    args = parser.parse_args(argv)
+
+    rules = load_rules(args.rules) if args.rules else STANDARD_RULES
+    start = perf_counter()
+    classes = analyze(rules)
+    edge = house_edge(classes)
+    elapsed = perf_counter() - start
+    print(f'Hand classes:       {len(classes)}')
+    print(f'House edge:         {float(edge):.6%} of ante ({edge})')
+    print(f'Pair plus return:   {float(pair_plus_return(classes)):.6%}')
+    print(f'Elapsed:            {elapsed:.2f}s')
+    if args.csv:
+        write_csv(classes, args.csv)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""EV-maximizing play/fold strategy, computed once from the exact analysis and cached on disk."""
+import os
+from itertools import combinations
+
+from model.deck import Deck
+from model.hand_rank import HAND_RANKS
+from model.rules import STANDARD_RULES
+from sim.exact import analyze, canonical
+
+CACHE_DIR = 'resources/strategy'
+
+# Offsets of the combinatorial number system, so a sorted hand a < b < c sits at a + _C2[b] + _C3[c]
+_C2 = tuple(n * (n - 1) // 2 for n in range(Deck.SIZE))
+_C3 = tuple(n * (n - 1) * (n - 2) // 6 for n in range(Deck.SIZE))
+
+def hand_index(a, b, c) -> int:
+    """Gets the position of a hand among the 22,100 hands in the combinatorial number system.
+    Args:
+        a, b, c (int): card codes in any order.
+    Returns:
+        int: index of the hand.
+    """
+    if a > b:
+        a, b = b, a
+    if b > c:
+        b, c = c, b
+        if a > b:
+            a, b = b, a
+    return a + _C2[b] + _C3[c]
+
+class StrategyTable:
+    """This class represents the best play wager for every hand, in antes, with 0 meaning fold."""
+    def __init__(self, wagers: bytes, key: str):
+        """Constructs the table.
+        Args:
+            wagers (bytes): play wager of every hand in hand_index() order.
+            key (str): Rules.digest() of the rules the table was computed for.
+        """
+        self.wagers = wagers
+        self.key = key
+
+    def play_wager(self, hand) -> int:
+        """Looks up the best play wager of a hand.
+        Args:
+            hand (tuple): the user's three cards.
+        Returns:
+            int: play wager in antes, 0 to fold.
+        """
+        a, b, c = hand
+        return self.wagers[hand_index(a.code, b.code, c.code)]
+
+    def __call__(self, hand, rank) -> bool:
+        """Decides a hand, so the table can be used as a sim strategy.
+        Args:
+            hand (tuple): the user's three cards.
+            rank (int): rank of the user's hand.
+        Returns:
+            bool: True to play, False to fold.
+        """
+        a, b, c = hand
+        return self.wagers[hand_index(a.code, b.code, c.code)] != 0
+
+def build_table(rules=STANDARD_RULES) -> StrategyTable:
+    """Computes the table from the exact EV of every suit-isomorphic hand class.
+    Args:
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+    Returns:
+        StrategyTable: best play wager of every hand.
+    """
+    decisions = {hand_class.codes: hand_class.play() for hand_class in analyze(rules)}
+    wagers = bytearray(len(HAND_RANKS))
+    for hand in combinations(range(Deck.SIZE), 3):
+        wagers[hand_index(*hand)] = 1 if decisions[canonical(hand)] else 0
+    return StrategyTable(bytes(wagers), rules.digest())
+
+def load_table(rules=STANDARD_RULES, directory=CACHE_DIR) -> StrategyTable:
+    """Loads the table for the given rules from disk, computing and saving it on a miss. A file of
+    the wrong size is treated as a miss. The table is written to a temporary file and moved into
+    place, so processes building it at the same time never read each other's partial writes.
+    Args:
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+        directory (str): cache directory. Defaults to CACHE_DIR.
+    Returns:
+        StrategyTable: best play wager of every hand.
+    """
+    key = rules.digest()
+    path = os.path.join(directory, key + '.bin')
+    try:
+        with open(path, 'rb') as file:
+            wagers = file.read()
+        if len(wagers) == len(HAND_RANKS):
+            return StrategyTable(wagers, key)
+    except FileNotFoundError:
+        pass
+
+    table = build_table(rules)
+    os.makedirs(directory, exist_ok=True)
+    temp = f'{path}.{os.getpid()}.tmp'
+    with open(temp, 'wb') as file:
+        file.write(table.wagers)
+    os.replace(temp, path)
+    return table
+
+_tables = {}
+_standard_table = None
+
+def optimal_table(rules=STANDARD_RULES) -> StrategyTable:
+    """Gets the table for the given rules, loading it once per process.
+    Args:
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+    Returns:
+        StrategyTable: best play wager of every hand.
+    """
+    key = rules.digest()
+    if key not in _tables:
+        _tables[key] = load_table(rules)
+    return _tables[key]
+
+def play_optimal(hand, rank) -> bool:
+    """Plays the EV-maximizing decision under the standard rules from the cached table.
+    Args:
+        hand (tuple): the user's three cards.
+        rank (int): rank of the user's hand.
+    Returns:
+        bool: True to play, False to fold.
+    """
+    global _standard_table
+    if _standard_table is None:
+        _standard_table = optimal_table()
+    a, b, c = hand
+    return _standard_table.wagers[hand_index(a.code, b.code, c.code)] != 0
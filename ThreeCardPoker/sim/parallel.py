@@ -0,0 +1,72 @@
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from random import Random
+from time import perf_counter
+
+from model.deck import Deck
+from model.rules import STANDARD_RULES
+from sim.engine import SimResult, simulate
+from sim.strategies import play_q64
+
+# Rounds per shard. Shards, not workers, own the random streams, so this must stay fixed for a
+# given seed to reproduce a run
+SHARD_SIZE = 1_000_000
+
+def shard_rng(seed, index) -> Random:
+    """Creates the random number generator of one shard. String seeds are hashed with SHA-512,
+    so the streams of neighbouring shards are independent.
+    Args:
+        seed (int): seed of the whole run.
+        index (int): position of the shard in the run.
+    Returns:
+        Random: generator for the shard.
+    """
+    return Random(f'{seed}/{index}')
+
+def shards(rounds, shard_size=SHARD_SIZE):
+    """Splits a number of rounds into shards.
+    Args:
+        rounds (int): total number of rounds.
+        shard_size (int): rounds per shard, the last shard takes the remainder. Defaults to SHARD_SIZE.
+    Returns:
+        list: (index, rounds) of every shard.
+    """
+    return [(index, min(shard_size, rounds - start)) for index, start in enumerate(range(0, rounds, shard_size))]
+
+def _run_shard(job) -> SimResult:
+    """Plays one shard in a worker process."""
+    seed, index, rounds, strategy, rules, pair_plus = job
+    return simulate(rounds, strategy=strategy, rules=rules, pair_plus=pair_plus, deck=Deck(rng=shard_rng(seed, index)))
+
+def simulate_parallel(rounds, strategy=play_q64, rules=STANDARD_RULES, pair_plus=None, seed=0, workers=None, shard_size=SHARD_SIZE):
+    """Splits a simulation into fixed size shards, each with its own seeded random stream, and
+    plays them across a process pool. Shards return running totals which are merged as exact
+    integer sums, so a seed gives the same result for any number of workers.
+    Args:
+        rounds (int): number of rounds to be played.
+        strategy (function): picklable play/fold strategy such as a module level function or a
+        StrategyTable, see simulate(). Defaults to play_q64.
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+        pair_plus (int): pair plus bet placed each round. Defaults to the ante of the rules.
+        seed (int): seed of the run. Defaults to 0.
+        workers (int): number of worker processes, 1 plays every shard in this process.
+        Defaults to the number of CPUs.
+        shard_size (int): rounds per shard. Defaults to SHARD_SIZE.
+    Returns:
+        SimResult: merged totals of the rounds played.
+    """
+    workers = workers or cpu_count() or 1
+    pair_plus = rules.ante if pair_plus is None else pair_plus
+    jobs = [(seed, index, n, strategy, rules, pair_plus) for index, n in shards(rounds, shard_size)]
+    result = SimResult(ante=rules.ante, pair_plus=pair_plus)
+
+    start = perf_counter()
+    if workers == 1:
+        for job in jobs:
+            result.merge(_run_shard(job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for shard_result in pool.map(_run_shard, jobs):
+                result.merge(shard_result)
+    result.elapsed = perf_counter() - start
+    return result
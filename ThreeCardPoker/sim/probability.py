@@ -0,0 +1,156 @@
+"""Exact odds of the dealer's hand given the cards known to be out of the deck.
+
+A query counts every dealer hand left once the user's three cards and any other exposed cards
+are removed, from rank histograms of all 22,100 hands built on the first query. Counts are cached
+by the suit-isomorphic form of the known cards, and whole answers by the cards as given, so
+repeated queries are dictionary lookups.
+"""
+from bisect import bisect_left, bisect_right
+from fractions import Fraction
+from functools import lru_cache
+from itertools import combinations
+
+from model.deck import Deck
+from model.hand_rank import HandType, HAND_RANKS, HAND_TYPE_SHIFT
+from model.rules import STANDARD_RULES
+from sim.exact import canonical
+
+# Every distinct rank in order, histograms count hands by index into it
+RANKS = tuple(sorted(set(HAND_RANKS.values())))
+# First rank index of each HandType, and one past the last
+_TYPE_BOUNDS = tuple(bisect_left(RANKS, t.value << HAND_TYPE_SHIFT) for t in HandType) + (len(RANKS),)
+
+class RankHistograms:
+    """This class represents the number of hands at each rank, among all hands, the hands holding
+    each card and the hands holding each pair of cards. Removing known cards from the deck is then
+    inclusion-exclusion over these histograms."""
+    def __init__(self):
+        """Constructs the histograms from the HAND_RANKS lookup table."""
+        index = {rank: i for i, rank in enumerate(RANKS)}
+        self.all = [0] * len(RANKS)
+        self.by_card = [[0] * len(RANKS) for _ in range(Deck.SIZE)]
+        # Hands holding a pair of cards are few, so they are kept as lists of rank indexes
+        self.by_pair = {}
+        self.by_hand = {}
+        for hand in combinations(range(Deck.SIZE), 3):
+            i = index[HAND_RANKS[1 << hand[0] | 1 << hand[1] | 1 << hand[2]]]
+            self.all[i] += 1
+            for code in hand:
+                self.by_card[code][i] += 1
+            for pair in combinations(hand, 2):
+                self.by_pair.setdefault(pair, []).append(i)
+            self.by_hand[hand] = i
+
+    def excluding(self, codes) -> list:
+        """Counts the hands at each rank that share no card with 'codes'.
+        Args:
+            codes (tuple): sorted card codes known to be out of the deck.
+        Returns:
+            list: number of hands at each index of RANKS.
+        """
+        counts = self.all
+        for code in codes:
+            counts = [n - m for n, m in zip(counts, self.by_card[code])]
+        if counts is self.all:
+            counts = list(counts)
+        for pair in combinations(codes, 2):
+            for i in self.by_pair[pair]:
+                counts[i] += 1
+        for hand in combinations(codes, 3):
+            counts[self.by_hand[hand]] -= 1
+        return counts
+
+_histograms = None
+
+def histograms() -> RankHistograms:
+    """Gets the rank histograms, built on the first call."""
+    global _histograms
+    if _histograms is None:
+        _histograms = RankHistograms()
+    return _histograms
+
+@lru_cache(maxsize=4096)
+def _dealer_counts(known) -> tuple:
+    """Counts the dealer hands at each rank for the canonical form of the known cards."""
+    return tuple(histograms().excluding(known))
+
+class DealerOdds:
+    """This class represents the exact distribution of the dealer's hand against a user's hand,
+    counted in dealer hands out of 'total', with the outcomes split the way sim.exact.HandClass
+    splits them."""
+    def __init__(self, counts, user_rank, rules=STANDARD_RULES):
+        """Constructs the odds from dealer hand counts.
+        Args:
+            counts (tuple): number of dealer hands at each index of RANKS.
+            user_rank (int): rank of the user's hand.
+            rules (Rules): rules of the table, for the dealer qualifier and the payouts. Defaults to STANDARD_RULES.
+        """
+        self.counts = counts
+        self.user_rank = user_rank
+        self.rules = rules
+        self.total = sum(counts)
+        self.by_type = {t: sum(counts[_TYPE_BOUNDS[t.value]:_TYPE_BOUNDS[t.value + 1]]) for t in HandType}
+
+        self.unqualified = sum(counts[:bisect_left(RANKS, rules.qualifier_rank)])
+        below = sum(counts[:bisect_left(RANKS, user_rank)])
+        at_or_below = sum(counts[:bisect_right(RANKS, user_rank)])
+        # Unqualified dealer hands all rank below a user hand that qualifies and none tie it
+        self.wins = max(0, below - self.unqualified)
+        self.ties = at_or_below - below if user_rank >= rules.qualifier_rank else 0
+        self.losses = self.total - self.unqualified - self.wins - self.ties
+
+    def ranks(self) -> dict:
+        """Gets the number of dealer hands at each rank they can hold."""
+        return {rank: n for rank, n in zip(RANKS, self.counts) if n}
+
+    def type_probabilities(self) -> dict:
+        """Gets the chance of the dealer holding each HandType."""
+        return {t: n / self.total for t, n in self.by_type.items()}
+
+    def unqualified_probability(self) -> float:
+        """Gets the chance the dealer does not qualify."""
+        return self.unqualified / self.total
+
+    def win_probability(self) -> float:
+        """Gets the chance the dealer qualifies and the user beats them."""
+        return self.wins / self.total
+
+    def tie_probability(self) -> float:
+        """Gets the chance the dealer qualifies and ties the user."""
+        return self.ties / self.total
+
+    def loss_probability(self) -> float:
+        """Gets the chance the dealer qualifies and beats the user."""
+        return self.losses / self.total
+
+    def play_ev(self) -> Fraction:
+        """Gets the exact expected value of playing, in antes, with the play wager equal to the ante.
+        Folding is always worth -1."""
+        rules = self.rules
+        return rules.ante_bonus_odds[self.user_rank >> HAND_TYPE_SHIFT] + Fraction(
+            self.unqualified * rules.ante_pays + self.wins * (rules.ante_pays + rules.play_pays) - 2 * self.losses, self.total)
+
+@lru_cache(maxsize=65536)
+def _dealer_odds(hand, exposed, rules) -> DealerOdds:
+    """Computes the odds for sorted code tuples."""
+    a, b, c = hand
+    return DealerOdds(_dealer_counts(canonical(hand + exposed)), HAND_RANKS[1 << a | 1 << b | 1 << c], rules)
+
+def dealer_odds(hand, exposed=(), rules=STANDARD_RULES) -> DealerOdds:
+    """Gets the exact distribution of the dealer's hand against a user's hand.
+    Args:
+        hand (iterable): the user's three cards, as Cards or card codes.
+        exposed (iterable): other cards known to be out of the deck, such as other seats' hands. Defaults to none.
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+    Raises:
+        ValueError: if the hand is not three cards or a card is known twice.
+    Returns:
+        DealerOdds: the distribution.
+    """
+    hand = tuple(sorted(getattr(card, 'code', card) for card in hand))
+    exposed = tuple(sorted(getattr(card, 'code', card) for card in exposed))
+    if len(hand) != 3:
+        raise ValueError('A hand is three cards')
+    if len(set(hand + exposed)) != len(hand) + len(exposed) or len(hand) + len(exposed) > Deck.SIZE - 3:
+        raise ValueError('Known cards must be distinct and leave a dealer hand in the deck')
+    return _dealer_odds(hand, exposed, rules)
@@ -0,0 +1,87 @@
+"""Pair plus exposure under different shuffling procedures.
+
+Deals rounds from a shoe, reading the exact pair plus EV of the next hand off the shoe's running
+counts before every round, and compares betting every round with betting only when the EV is
+above a threshold, as a player tracking the cards would.
+
+Run from the ThreeCardPoker directory:
+    python -m sim.shoes --shoe shoe --decks 6 --penetration 0.8 --seats 6
+    python -m sim.shoes --shoe csm --decks 4 --buffer 20
+"""
+import random
+from argparse import ArgumentParser
+from time import perf_counter
+
+from model.hand_rank import HAND_TYPE_SHIFT, rank_hand
+from model.rules import STANDARD_RULES, load_rules
+from model.shoe import ContinuousShuffler, MultiDeckShoe
+
+def pair_plus_exposure(rounds, shoe, seats=1, rules=STANDARD_RULES, threshold=0.0) -> dict:
+    """Plays the pair plus bet at every seat for a number of rounds.
+    Args:
+        rounds (int): number of rounds to be dealt.
+        shoe (Shoe): shoe to deal from.
+        seats (int): seats dealt each round. Defaults to 1.
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+        threshold (float): EV per unit bet above which a tracking player bets. Defaults to 0.
+    Returns:
+        dict: bets and net return per unit bet, betting every round and betting above the
+        threshold, with the mean EV read off the shoe.
+    """
+    returns = rules.pair_plus_returns
+    n = 3 * seats
+    bets = net = tracked_bets = tracked_net = 0
+    ev_sum = 0.0
+
+    start = perf_counter()
+    for _ in range(rounds):
+        ev = shoe.pair_plus_ev(rules)
+        ev_sum += ev
+        cards = shoe.get_n_cards(n + 3)
+        round_net = sum(returns[rank_hand(cards[i:i + 3]) >> HAND_TYPE_SHIFT] - 1 for i in range(0, n, 3))
+        bets += seats
+        net += round_net
+        if ev > threshold:
+            tracked_bets += seats
+            tracked_net += round_net
+        shoe.reset()
+
+    return {
+        'rounds': rounds,
+        'bets': bets,
+        'return': net / bets,
+        'mean_ev': ev_sum / rounds,
+        'tracked_bets': tracked_bets,
+        'tracked_return': tracked_net / tracked_bets if tracked_bets else 0.0,
+        'elapsed': perf_counter() - start,
+    }
+
+def main(argv=None):
+    """Parses the command line, deals the rounds and prints the report."""
+    parser = ArgumentParser(prog='python -m sim.shoes', description='Pair plus exposure by shuffling procedure.')
+    parser.add_argument('--shoe', choices=('shoe', 'csm'), default='shoe', help='multi-deck shoe with a cut card or continuous shuffler')
+    parser.add_argument('--decks', type=int, default=6, help='decks in the shoe')
+    parser.add_argument('--penetration', type=float, default=0.75, help='share of the shoe dealt before the cut card')
+    parser.add_argument('--buffer', type=int, default=20, help='cards held in the continuous shuffler buffer')
+    parser.add_argument('--seats', type=int, default=1, help='seats dealt each round')
+    parser.add_argument('--rounds', type=int, default=100_000, help='number of rounds to deal')
+    parser.add_argument('--threshold', type=float, default=0.0, help='EV above which the tracking player bets')
+    parser.add_argument('--rules', help='JSON file of table rules, defaults to the standard rules')
+    parser.add_argument('--seed', type=int, help='seed for a reproducible run')
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    if args.shoe == 'shoe':
+        shoe = MultiDeckShoe(decks=args.decks, penetration=args.penetration, rng=rng)
+    else:
+        shoe = ContinuousShuffler(decks=args.decks, buffer=args.buffer, rng=rng)
+    rules = load_rules(args.rules) if args.rules else STANDARD_RULES
+    result = pair_plus_exposure(args.rounds, shoe, seats=args.seats, rules=rules, threshold=args.threshold)
+    print(f'Rounds:             {result["rounds"]}')
+    print(f'Pair plus return:   {result["return"]:.4%} over {result["bets"]} bets')
+    print(f'Mean EV of shoe:    {result["mean_ev"]:.4%}')
+    print(f'Tracked return:     {result["tracked_return"]:.4%} over {result["tracked_bets"]} bets above {args.threshold:.2%}')
+    print(f'Rounds per second:  {result["rounds"] / result["elapsed"]:,.0f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+from functools import partial
+
+from model.hand_rank import Q64_RANK
+from model.rules import STANDARD_RULES
+from sim.optimal import optimal_table, play_optimal
+
+def always_play(hand, rank):
+    """Plays every hand.
+    Args:
+        hand (tuple): the user's three cards.
+        rank (int): rank of the user's hand.
+    Returns:
+        bool: True to play, False to fold.
+    """
+    return True
+
+def play_q64(hand, rank):
+    """Plays queen, six, four or better and folds everything below it.
+    Args:
+        hand (tuple): the user's three cards.
+        rank (int): rank of the user's hand.
+    Returns:
+        bool: True to play, False to fold.
+    """
+    return rank >= Q64_RANK
+
+def play_mimic(hand, rank, qualifier_rank=STANDARD_RULES.qualifier_rank):
+    """Mimics the dealer, playing every hand the dealer would qualify with.
+    Args:
+        hand (tuple): the user's three cards.
+        rank (int): rank of the user's hand.
+        qualifier_rank (int): rank the dealer qualifies with. Defaults to the standard rules' queen high.
+    Returns:
+        bool: True to play, False to fold.
+    """
+    return rank >= qualifier_rank
+
+def make_mimic(rules=STANDARD_RULES):
+    """Builds play_mimic for the dealer qualifier of the given rules, picklable for sim.parallel.
+    Args:
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+    Returns:
+        function: play/fold strategy.
+    """
+    return partial(play_mimic, qualifier_rank=rules.qualifier_rank)
+
+STRATEGIES = {
+    'always': always_play,
+    'q64': play_q64,
+    'optimal': play_optimal,
+    'mimic': play_mimic,
+}
+
+def strategies_for(rules=STANDARD_RULES) -> dict:
+    """Gets STRATEGIES with the ones that depend on the rules built for the given rules.
+    Args:
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+    Returns:
+        dict: strategies by name.
+    """
+    if rules.digest() == STANDARD_RULES.digest():
+        return STRATEGIES
+    return {**STRATEGIES, 'optimal': optimal_table(rules), 'mimic': make_mimic(rules)}
@@ -0,0 +1,166 @@
+"""Tournament of play/fold strategies on common random numbers.
+
+Every strategy plays exactly the same deals. Each round is dealt and both hands are ranked once,
+the results of playing and of folding are settled once, and each strategy only picks one of the
+two. Differences between strategies are measured round by round, so their confidence intervals
+are far narrower than those of independent runs of the same length.
+
+Run from the ThreeCardPoker directory:
+    python -m sim.tournament --rounds 1000000 --strategies always q64 optimal mimic --baseline q64
+"""
+import random
+from argparse import ArgumentParser
+from math import sqrt
+from time import perf_counter
+
+from model.deck import Deck
+from model.hand_rank import HAND_RANKS
+from model.rules import STANDARD_RULES, load_rules
+from sim.strategies import STRATEGIES, strategies_for
+
+# Normal quantile of a two-sided 95% confidence interval
+Z_95 = 1.959964
+
+class Totals:
+    """This class represents the exact integer sums of a per-round series, from which its mean,
+    variance and confidence interval are read."""
+    def __init__(self):
+        """Constructs empty totals."""
+        self.count = 0
+        self.sum = 0
+        self.sq = 0
+
+    def mean(self) -> float:
+        """Gets the mean per round."""
+        return self.sum / self.count if self.count else 0.0
+
+    def variance(self) -> float:
+        """Gets the sample variance per round."""
+        if self.count < 2:
+            return 0.0
+        return (self.sq - self.sum * self.sum / self.count) / (self.count - 1)
+
+    def half_width(self, z=Z_95) -> float:
+        """Gets the half width of the confidence interval of the mean.
+        Args:
+            z (float): normal quantile of the interval. Defaults to Z_95.
+        """
+        return z * sqrt(self.variance() / self.count) if self.count else 0.0
+
+class Tournament:
+    """This class represents the results of a tournament: for each strategy the net result of the
+    ante and play wager per round, the rounds it played, and its net result minus the baseline's
+    on the same round."""
+    def __init__(self, names, baseline, ante):
+        """Constructs empty results.
+        Args:
+            names (list): names of the strategies.
+            baseline (str): name of the strategy the others are measured against.
+            ante (int): ante of the table, results are reported in antes.
+        """
+        self.names = list(names)
+        self.baseline = baseline
+        self.ante = ante
+        self.results = {name: Totals() for name in self.names}
+        self.differences = {name: Totals() for name in self.names}
+        self.played = dict.fromkeys(self.names, 0)
+        self.rounds = 0
+        self.elapsed = 0.0
+
+    def report(self) -> str:
+        """Formats the results for the command line, best strategy first, in antes per round with
+        95% confidence intervals. The independent interval is what the difference would have
+        had from separate runs of the same length.
+        Returns:
+            str: one strategy per line.
+        """
+        ante = self.ante
+        base = self.results[self.baseline]
+        lines = [f'Rounds: {self.rounds} dealt once, {self.rounds / self.elapsed:,.0f} per second' if self.elapsed else f'Rounds: {self.rounds}',
+                 f'{"strategy":<10}{"played":>9}{"EV (antes)":>22}{"vs " + self.baseline:>22}{"independent":>14}']
+        for name in sorted(self.names, key=lambda name: self.results[name].mean(), reverse=True):
+            result, difference = self.results[name], self.differences[name]
+            independent = Z_95 * sqrt((result.variance() + base.variance()) / self.rounds) / ante
+            lines.append(f'{name:<10}{self.played[name] / self.rounds:>9.2%}'
+                         f'{result.mean() / ante:>+12.5f} ± {result.half_width() / ante:.5f}'
+                         f'{difference.mean() / ante:>+12.5f} ± {difference.half_width() / ante:.5f}'
+                         f'{"± " + format(independent, ".5f"):>14}')
+        return '\n'.join(lines)
+
+def run_tournament(rounds, strategies, baseline=None, rules=STANDARD_RULES, deck=None) -> Tournament:
+    """Plays every strategy on the same rounds, with the play wager equal to the ante.
+    Args:
+        rounds (int): number of rounds to be dealt.
+        strategies (dict): strategies by name, each taking the user's hand and its rank and
+        returning True to play or False to fold.
+        baseline (str): name of the strategy the others are measured against. Defaults to the first.
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+        deck (Deck): deck to deal from. Defaults to a new Deck().
+    Returns:
+        Tournament: results of every strategy.
+    """
+    deck = Deck() if deck is None else deck
+    baseline = next(iter(strategies)) if baseline is None else baseline
+    tournament = Tournament(strategies, baseline, rules.ante)
+    ante = rules.ante
+    fold_net = -ante
+    reset = deck.reset
+    deal = deck.get_n_cards
+    ranks = HAND_RANKS
+    settle = rules.settle
+    entries = [(strategies[name], tournament.results[name], tournament.differences[name], name) for name in strategies]
+    played = tournament.played
+    base_index = list(strategies).index(baseline)
+    nets = [0] * len(entries)
+
+    start = perf_counter()
+    for _ in range(rounds):
+        reset()
+        cards = deal(6)
+        a, b, c, d, e, f = cards
+        user_rank = ranks[a.mask | b.mask | c.mask]
+        dealer_rank = ranks[d.mask | e.mask | f.mask]
+        hand = cards[:3]
+        play_net = settle(user_rank, dealer_rank, ante, ante) - 2 * ante
+
+        for i, (strategy, result, _, name) in enumerate(entries):
+            if strategy(hand, user_rank):
+                net = play_net
+                played[name] += 1
+            else:
+                net = fold_net
+            nets[i] = net
+            result.sum += net
+            result.sq += net * net
+        base_net = nets[base_index]
+        for (_, _, difference, _), net in zip(entries, nets):
+            net -= base_net
+            difference.sum += net
+            difference.sq += net * net
+
+    tournament.elapsed = perf_counter() - start
+    tournament.rounds = rounds
+    for _, result, difference, _ in entries:
+        result.count = difference.count = rounds
+    return tournament
+
+def main(argv=None):
+    """Parses the command line, runs the tournament and prints the report."""
+    parser = ArgumentParser(prog='python -m sim.tournament', description='Compare play/fold strategies on the same deals.')
+    parser.add_argument('--rounds', type=int, default=1_000_000, help='number of rounds to deal')
+    parser.add_argument('--strategies', nargs='+', choices=sorted(STRATEGIES), default=sorted(STRATEGIES), help='strategies to compare')
+    parser.add_argument('--baseline', choices=sorted(STRATEGIES), help='strategy the others are measured against, defaults to the first')
+    parser.add_argument('--rules', help='JSON file of table rules, defaults to the standard rules')
+    parser.add_argument('--seed', type=int, help='seed for a reproducible run')
+    args = parser.parse_args(argv)
+
+    rules = load_rules(args.rules) if args.rules else STANDARD_RULES
+    available = strategies_for(rules)
+    strategies = {name: available[name] for name in args.strategies}
+    if args.baseline is not None and args.baseline not in strategies:
+        strategies[args.baseline] = available[args.baseline]
+    deck = Deck(rng=random.Random(args.seed))
+    print(run_tournament(args.rounds, strategies, baseline=args.baseline, rules=rules, deck=deck).report())
+
+if __name__ == '__main__':
+    main()
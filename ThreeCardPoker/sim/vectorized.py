@@ -0,0 +1,201 @@
+"""Batch dealing, hand classification and settlement with NumPy arrays.
+
+NumPy is only needed by this module; the rest of the game runs without it.
+"""
+from functools import partial
+from itertools import combinations
+from time import perf_counter
+
+import numpy as np
+
+from model.deck import Deck
+from model.hand_rank import HandType, HAND_TYPE_SHIFT
+from model.rules import STANDARD_RULES
+from sim.engine import SimResult
+from sim.optimal import optimal_table
+from sim.strategies import Q64_RANK
+
+# Rounds dealt per batch, which bounds the (BATCH_SIZE, 52) deck array to a few megabytes
+BATCH_SIZE = 1 << 16
+
+def _repeated(codes) -> np.ndarray:
+    """Flags the rows of an (m, 6) code array holding the same code twice."""
+    cols = np.ascontiguousarray(codes.T)
+    repeated = np.zeros(len(codes), dtype=bool)
+    for i, j in combinations(range(6), 2):
+        repeated |= cols[i] == cols[j]
+    return repeated
+
+def deal_batch(m, rng) -> np.ndarray:
+    """Deals 'm' rounds at once. Each round draws six codes independently and rows holding a
+    repeated code are drawn again, which leaves every ordered deal of six distinct cards equally
+    likely, the same distribution Deck.get_n_cards gives a single round.
+    Args:
+        m (int): number of rounds.
+        rng (numpy.random.Generator): random number generator.
+    Returns:
+        numpy.ndarray: (m, 6) int16 card codes, the user's three cards then the dealer's.
+    """
+    codes = rng.integers(0, Deck.SIZE, size=(m, 6), dtype=np.int16)
+    redraw = np.flatnonzero(_repeated(codes))
+    while len(redraw):
+        codes[redraw] = rng.integers(0, Deck.SIZE, size=(len(redraw), 6), dtype=np.int16)
+        redraw = redraw[_repeated(codes[redraw])]
+    return codes
+
+def rank_batch(hands) -> np.ndarray:
+    """Ranks three card hands with array operations, giving the same packed ranks as the
+    HAND_RANKS lookup table.
+    Args:
+        hands (numpy.ndarray): (m, 3) integer card codes.
+    Returns:
+        numpy.ndarray: (m,) int32 packed ranks.
+    """
+    hands = hands.astype(np.int32, copy=False)
+    x, y, z = hands[:, 0] >> 2, hands[:, 1] >> 2, hands[:, 2] >> 2
+    hi = np.maximum(np.maximum(x, y), z)
+    lo = np.minimum(np.minimum(x, y), z)
+    mid = x + y + z - hi - lo
+    suit = hands & 3
+    flush = (suit[:, 0] == suit[:, 1]) & (suit[:, 1] == suit[:, 2])
+    trips = hi == lo
+    pair = ((hi == mid) | (mid == lo)) & ~trips
+    # Values here run 0 (two) to 12 (ace)
+    wheel = (hi == 12) & (mid == 1) & (lo == 0)
+    straight = ((hi - lo == 2) & ~pair & ~trips) | wheel
+
+    # Flushes never hold a pair or trips and straights never hold a pair, so the types add up,
+    # with a straight flush being STRAIGIHT + FLUSH
+    hand_type = (trips * HandType.THREE_OF_A_KIND.value + straight * HandType.STRAIGIHT.value
+                 + flush * HandType.FLUSH.value + pair * HandType.PAIR.value)
+    # Low pairs move the kicker last and the A-2-3 straight ranks as 3-2-1
+    low_pair = pair & (mid == lo)
+    a = np.where(wheel, 1, np.where(low_pair, mid, hi)) + 2
+    b = np.where(wheel, 0, mid) + 2
+    c = np.where(wheel, -1, np.where(low_pair, hi, lo)) + 2
+    return hand_type << HAND_TYPE_SHIFT | a << 8 | b << 4 | c
+
+def always_play_batch(hands, ranks) -> np.ndarray:
+    """Plays every hand, the batch form of sim.strategies.always_play.
+    Args:
+        hands (numpy.ndarray): (m, 3) card codes of the user's hands.
+        ranks (numpy.ndarray): (m,) ranks of the user's hands.
+    Returns:
+        numpy.ndarray: (m,) True to play, False to fold.
+    """
+    return np.ones(len(ranks), dtype=bool)
+
+def play_q64_batch(hands, ranks) -> np.ndarray:
+    """Plays queen, six, four or better, the batch form of sim.strategies.play_q64.
+    Args:
+        hands (numpy.ndarray): (m, 3) card codes of the user's hands.
+        ranks (numpy.ndarray): (m,) ranks of the user's hands.
+    Returns:
+        numpy.ndarray: (m,) True to play, False to fold.
+    """
+    return ranks >= Q64_RANK
+
+def play_optimal_batch(hands, ranks, table=None) -> np.ndarray:
+    """Plays the EV-maximizing decision, the batch form of sim.optimal.play_optimal.
+    Args:
+        hands (numpy.ndarray): (m, 3) card codes of the user's hands.
+        ranks (numpy.ndarray): (m,) ranks of the user's hands.
+        table (StrategyTable): table of the rules being played. Defaults to the standard rules' table.
+    Returns:
+        numpy.ndarray: (m,) True to play, False to fold.
+    """
+    a, b, c = np.sort(hands, axis=1).astype(np.int64).T
+    wagers = np.frombuffer((optimal_table() if table is None else table).wagers, dtype=np.uint8)
+    return wagers[a + b * (b - 1) // 2 + c * (c - 1) * (c - 2) // 6] != 0
+
+def play_mimic_batch(hands, ranks, qualifier_rank=STANDARD_RULES.qualifier_rank) -> np.ndarray:
+    """Plays every hand the dealer would qualify with, the batch form of sim.strategies.play_mimic.
+    Args:
+        hands (numpy.ndarray): (m, 3) card codes of the user's hands.
+        ranks (numpy.ndarray): (m,) ranks of the user's hands.
+        qualifier_rank (int): rank the dealer qualifies with. Defaults to the standard rules' queen high.
+    Returns:
+        numpy.ndarray: (m,) True to play, False to fold.
+    """
+    return ranks >= qualifier_rank
+
+BATCH_STRATEGIES = {
+    'always': always_play_batch,
+    'q64': play_q64_batch,
+    'optimal': play_optimal_batch,
+    'mimic': play_mimic_batch,
+}
+
+def batch_strategies_for(rules=STANDARD_RULES) -> dict:
+    """Gets BATCH_STRATEGIES with the ones that depend on the rules built for the given rules,
+    the batch form of sim.strategies.strategies_for.
+    Args:
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+    Returns:
+        dict: batch strategies by name.
+    """
+    if rules.digest() == STANDARD_RULES.digest():
+        return BATCH_STRATEGIES
+    return {**BATCH_STRATEGIES, 'optimal': partial(play_optimal_batch, table=optimal_table(rules)),
+            'mimic': partial(play_mimic_batch, qualifier_rank=rules.qualifier_rank)}
+
+def settle_batch(user_ranks, dealer_ranks, play, rules=STANDARD_RULES, pair_plus=None):
+    """Settles rounds as arrays the same way Rules.settle and Rules.pair_plus_payout settle a single round.
+    Args:
+        user_ranks (numpy.ndarray): (m,) ranks of the user's hands.
+        dealer_ranks (numpy.ndarray): (m,) ranks of the dealer's hands.
+        play (numpy.ndarray): (m,) True where the user plays, False where they fold.
+        rules (Rules): rules of the table, the play wager equals its ante. Defaults to STANDARD_RULES.
+        pair_plus (int): pair plus bet placed each round. Defaults to the ante of the rules.
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray): (m,) int64 net results of the ante and play wager
+        and of the pair plus bet.
+    """
+    ante = rules.ante
+    pair_plus = ante if pair_plus is None else pair_plus
+    hand_types = user_ranks >> HAND_TYPE_SHIFT
+    pair_plus_returns = np.asarray(rules.pair_plus_returns, dtype=np.int64)
+    pair_plus_net = pair_plus * pair_plus_returns[hand_types] - pair_plus
+
+    ante_bonus = ante * np.asarray(rules.ante_bonus_odds, dtype=np.int64)[hand_types]
+    win = ante * rules.ante_pays + ante * rules.play_pays
+    played_net = np.where(dealer_ranks < rules.qualifier_rank, ante * rules.ante_pays,
+                          np.where(user_ranks > dealer_ranks, win,
+                                   np.where(user_ranks == dealer_ranks, 0, -2 * ante)))
+    main_net = np.where(play, ante_bonus + played_net, -ante).astype(np.int64)
+    return main_net, pair_plus_net
+
+def simulate_batch(rounds, strategy=play_q64_batch, rules=STANDARD_RULES, pair_plus=None, seed=None, batch_size=BATCH_SIZE):
+    """Plays rounds in batches of arrays, the vectorized form of sim.engine.simulate.
+    Args:
+        rounds (int): number of rounds to be played.
+        strategy (function): takes (m, 3) user hands and their (m,) ranks and returns an (m,)
+        array, True to play and False to fold. Defaults to play_q64_batch.
+        rules (Rules): rules of the table. Defaults to STANDARD_RULES.
+        pair_plus (int): pair plus bet placed each round. Defaults to the ante of the rules.
+        seed (int): seed of the random number generator. Defaults to None.
+        batch_size (int): rounds per batch. Defaults to BATCH_SIZE.
+    Returns:
+        SimResult: totals of the rounds played.
+    """
+    rng = np.random.default_rng(seed)
+    pair_plus = rules.ante if pair_plus is None else pair_plus
+    result = SimResult(ante=rules.ante, pair_plus=pair_plus)
+
+    start = perf_counter()
+    for done in range(0, rounds, batch_size):
+        codes = deal_batch(min(batch_size, rounds - done), rng)
+        user_ranks = rank_batch(codes[:, :3])
+        dealer_ranks = rank_batch(codes[:, 3:])
+        play = strategy(codes[:, :3], user_ranks)
+        main_net, pair_plus_net = settle_batch(user_ranks, dealer_ranks, play, rules=rules, pair_plus=pair_plus)
+
+        result.rounds += len(codes)
+        result.played += int(play.sum())
+        result.wins += int((play & (user_ranks > dealer_ranks)).sum())
+        result.main_sum += int(main_net.sum())
+        result.main_sq += int((main_net * main_net).sum())
+        result.pair_plus_sum += int(pair_plus_net.sum())
+        result.pair_plus_sq += int((pair_plus_net * pair_plus_net).sum())
+    result.elapsed = perf_counter() - start
+    return result
@@ -0,0 +1,41 @@
+"""Checks of the table service's request handling. Run from the ThreeCardPoker directory with:
+    python -m pytest tests
+"""
+import asyncio
+import json
+
+import pytest
+
+from model.table import TablePool
+from server.table import TableServer, TableSession
+
+@pytest.mark.parametrize('pair_plus', [0.0, -0.0, '5', 1000.5, True, -1000, 500])
+def test_rejected_pair_plus_keeps_money(pair_plus):
+    session = TableSession(TablePool().acquire())
+    money = session.model.user.money
+    response = session.handle({'op': 'deal', 'pair_plus': pair_plus})
+    assert not response['ok']
+    assert session.model.user.money == money
+    assert session.handle({'op': 'deal'})['ok']
+    assert session.model.user.money == money - session.model.rules.ante
+
+def test_malformed_lines_get_replies():
+    async def exchange():
+        server = await TableServer().start(port=0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        replies = []
+        for line in (b'\xff\xfe\n', b'[1]\n', b'{"op": "balance"}\n', b'{"op": "' + b'x' * (1 << 17) + b'"}\n'):
+            writer.write(line)
+            await writer.drain()
+            replies.append(json.loads(await reader.readline()))
+        closed = await reader.readline() == b''
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return replies, closed
+
+    replies, closed = asyncio.run(exchange())
+    assert [reply['ok'] for reply in replies] == [False, False, True, False]
+    assert replies[-1]['error'] == 'Request too long'
+    assert closed
@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+
+from model.model import Model
+
+class BaseView(ABC):
+    """This class represents the interface the controller drives a view through (abstract). A view
+    shows the stage named by curr_display on display() and produces the controller's events, along
+    with the values of its bet sliders in whole dollars, from get_events_values()."""
+    STAGES = ('menu', 'prebet', 'bet', 'postbet', 'gameover')
+
+    def __init__(self, model=None, display='menu', hint=False) -> None:
+        """Constructs a view of a model.
+        Args:
+            model (_type_): the model the view is constructed from. Defaults to a new Model().
+            display (str): stage shown by display(). Defaults to 'menu'.
+            hint (bool): shows the best play or fold decision on the bet screen. Defaults to False.
+        """
+        self.model = Model() if model is None else model
+        self.curr_display = display
+        self.hint = hint
+        self.error = None
+
+    def max_bet(self):
+        """Gets the largest bet in cents the user can place, limited by their money and the table maximum."""
+        if self.model.rules.max_bet is None:
+            return self.model.user.money
+        return min(self.model.user.money, self.model.rules.max_bet)
+
+    def hint_text(self):
+        """Gets the best decision for the user's hand from the cached optimal strategy table, with
+        the exact odds of the dealer's hand.
+        Returns:
+            str: hint shown on the bet screen.
+        """
+        from sim.optimal import optimal_table
+        from sim.probability import dealer_odds
+        rules = self.model.rules
+        hand = self.model.user.hand
+        odds = dealer_odds(hand, rules=rules)
+        decision = 'Play' if optimal_table(rules).play_wager(hand) else 'Fold'
+        return (f'Hint: {decision} (no qualify {odds.unqualified_probability():.0%}, win {odds.win_probability():.0%}, '
+                f'tie {odds.tie_probability():.0%}, lose {odds.loss_probability():.0%})')
+
+    @abstractmethod
+    def display(self):
+        """Shows the stage named by curr_display.
+        Raises:
+            NotImplementedError: if curr_display is not one of STAGES.
+        """
+
+    @abstractmethod
+    def get_events_values(self, timeout=None):
+        """Gets the next event and the values that go with it.
+        Args:
+            timeout (int): milliseconds to wait for an event, None to block. Defaults to None.
+        Returns:
+            events, values: the event, None once the view is closed, and a dict of values.
+        """
+
+    def show_error(self, message):
+        """Tells the user why their last action was refused, such as a bet outside the table limits
+        or more than their money, on the stage being shown.
+        Args:
+            message (str): error message.
+        """
+        self.error = message
+
+    def close(self):
+        """Closes the view."""
@@ -0,0 +1,88 @@
+"""View backends without a GUI toolkit, for running the controller on a headless machine and
+for driving it from scripts and soak tests."""
+from model.hand_rank import Q64_RANK, rank_hand
+from model.money import CENTS
+from view.base import BaseView
+
+class NullView(BaseView):
+    """This class represents a view that shows nothing and closes on the first read, so the game
+    loop quits as soon as it asks for an event."""
+    def display(self):
+        """Checks the stage and shows nothing."""
+        if self.curr_display not in self.STAGES:
+            raise NotImplementedError(self.curr_display + ' is not a valid display option')
+
+    def get_events_values(self, timeout=None):
+        """Reads as a closed window."""
+        return None, {}
+
+class ScriptedView(NullView):
+    """This class represents a view whose events come from a script: either an iterable of
+    (event, values) pairs or a function that takes the view and returns the next pair. The view
+    reads as closed once the script runs out. Displays are counted by stage."""
+    def __init__(self, script, model=None, display='menu', hint=False) -> None:
+        """Constructs a view of a model driven by a script.
+        Args:
+            script (iterable or function): (event, values) pairs, or a function of the view giving the next pair.
+            model (_type_): the model the view is constructed from. Defaults to a new Model().
+            display (str): stage shown by display(). Defaults to 'menu'.
+            hint (bool): shows the best play or fold decision on the bet screen. Defaults to False.
+        """
+        super().__init__(model=model, display=display, hint=hint)
+        if callable(script):
+            self.next_event = script
+        else:
+            events = iter(script)
+            self.next_event = lambda view: next(events)
+        self.displays = dict.fromkeys(self.STAGES, 0)
+
+    def display(self):
+        """Checks the stage and counts it."""
+        super().display()
+        self.displays[self.curr_display] += 1
+
+    def get_events_values(self, timeout=None):
+        """Gets the next (event, values) pair of the script, reading as closed once it runs out."""
+        try:
+            return self.next_event(self)
+        except StopIteration:
+            return None, {}
+
+class AutoPlayer:
+    """This class represents a script for ScriptedView that plays like a user at the window: it
+    starts, bets pair plus, plays or folds with a strategy, goes on to the next round and plays
+    again after a game over, quitting after a number of rounds. Bets the user cannot cover are
+    skipped, folding instead of an unaffordable play wager."""
+    def __init__(self, rounds, pair_plus=0, strategy=None):
+        """Constructs the script.
+        Args:
+            rounds (int): rounds to play before quitting.
+            pair_plus (int): pair plus bet each round, in cents. Defaults to 0.
+            strategy (function): takes the user's hand and its rank and returns True to play.
+            Defaults to None, playing queen, six, four or better like sim.strategies.play_q64.
+        """
+        self.rounds = rounds
+        self.pair_plus = pair_plus
+        self.strategy = strategy
+        self.played = 0
+
+    def __call__(self, view) -> tuple:
+        """Gets the event a user would give the stage the view is showing."""
+        stage = view.curr_display
+        if stage == 'menu':
+            return 'Start', {}
+        if stage == 'prebet':
+            amount = self.pair_plus if self.pair_plus <= view.max_bet() else 0
+            return 'Bet', {'PreBet-Slider': amount // CENTS}
+        if stage == 'bet':
+            hand = view.model.user.hand
+            wager = view.model.rules.ante
+            rank = rank_hand(hand)
+            play = rank >= Q64_RANK if self.strategy is None else self.strategy(hand, rank)
+            if wager <= view.max_bet() and play:
+                return 'Bet', {'Bet-Slider': wager // CENTS}
+            return 'Fold', {}
+        if stage == 'postbet':
+            self.played += 1
+            return ('Quit', {}) if self.played >= self.rounds else ('Next Round', {})
+        return 'Play Again', {}
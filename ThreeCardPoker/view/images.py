@@ -0,0 +1,93 @@
+"""In-memory card images, so rendering a round does no disk I/O.
+
+The 53 PNGs are read from resources/cards/ on first use, or all at once from a single atlas file
+when one has been packed with:
+    python -m view.images
+"""
+import json
+import os
+from functools import lru_cache
+
+from model.card import Card
+
+CARD_DIR = 'resources/cards'
+ATLAS_PATH = 'resources/cards.atlas'
+CARD_BACK = 'card_back'
+
+def image_name(card) -> str:
+    """Gets the file name, without extension, of a card's image, such as '14S' for the ace of spades."""
+    return str(card.card_value) + card.card_suit.name[0]
+
+def pack_atlas(directory=CARD_DIR, path=ATLAS_PATH):
+    """Packs every card image into one file: a JSON line mapping each name to its (offset, length)
+    in the PNG data that follows.
+    Args:
+        directory (str): directory of the card PNGs. Defaults to CARD_DIR.
+        path (str): atlas file to be written. Defaults to ATLAS_PATH.
+    """
+    names = [image_name(card) for card in Card.ALL] + [CARD_BACK]
+    blobs = []
+    for name in names:
+        with open(os.path.join(directory, name + '.png'), 'rb') as file:
+            blobs.append(file.read())
+
+    index = {}
+    offset = 0
+    for name, blob in zip(names, blobs):
+        index[name] = (offset, len(blob))
+        offset += len(blob)
+    with open(path, 'wb') as file:
+        file.write(json.dumps(index).encode() + b'\n')
+        for blob in blobs:
+            file.write(blob)
+
+class CardImages:
+    """This class represents the PNG bytes of the card images behind a bounded LRU cache. Every
+    face down card shares the one card back entry."""
+    def __init__(self, directory=CARD_DIR, atlas=ATLAS_PATH, maxsize=64):
+        """Constructs the cache. Nothing is read until an image is first asked for.
+        Args:
+            directory (str): directory of the card PNGs. Defaults to CARD_DIR.
+            atlas (str): packed atlas used instead of the PNGs when it exists. Defaults to ATLAS_PATH.
+            maxsize (int): most images kept in memory. Defaults to 64, enough for all 53.
+        """
+        self.directory = directory
+        self.atlas = atlas
+        self._atlas_data = None
+        self.get = lru_cache(maxsize=maxsize)(self._load)
+        self.names = tuple(image_name(card) for card in Card.ALL)
+
+    def _load(self, name) -> bytes:
+        """Reads one image, from the atlas if there is one.
+        Args:
+            name (str): image name, such as '14S' or CARD_BACK.
+        Returns:
+            bytes: PNG data.
+        """
+        if self.atlas is not None and os.path.exists(self.atlas):
+            if self._atlas_data is None:
+                with open(self.atlas, 'rb') as file:
+                    header, data = file.read().split(b'\n', 1)
+                self._atlas_data = (json.loads(header), memoryview(data))
+            index, data = self._atlas_data
+            offset, length = index[name]
+            return bytes(data[offset:offset + length])
+        with open(os.path.join(self.directory, name + '.png'), 'rb') as file:
+            return file.read()
+
+    def card(self, card) -> bytes:
+        """Gets the image of a face up card."""
+        return self.get(self.names[card.code])
+
+    def back(self) -> bytes:
+        """Gets the image of a face down card."""
+        return self.get(CARD_BACK)
+
+    def preload(self):
+        """Loads every image up front, such as at startup."""
+        for name in self.names + (CARD_BACK,):
+            self.get(name)
+
+if __name__ == '__main__':
+    pack_atlas()
+    print(f'Packed {len(Card.ALL) + 1} card images into {ATLAS_PATH}')
@@ -1,145 +1,185 @@
-import PySimpleGUI as sg
+from model.money import CENTS, format_money
+from view.base import BaseView
+from view.images import CardImages
 
-from model.model import Model
+class View(BaseView):
+    """This class represents the view of the game, controlling the visual aspects of each stage of the game.
+    A single window holds the layout of every stage as a column, built once; changing stage updates the
+    elements of its column in place and makes it the only visible one. PySimpleGUI is only imported
+    once the window is built."""
+    # Button keys are unique per stage, this maps them back to the events the controller handles
+    EVENTS = {
+        'Menu-Start': 'Start', 'Menu-Quit': 'Quit',
+        'PreBet-Bet': 'Bet',
+        'Bet-Bet': 'Bet', 'Bet-Fold': 'Fold',
+        'PostBet-Next': 'Next Round', 'PostBet-Quit': 'Quit',
+        'GameOver-Again': 'Play Again', 'GameOver-Quit': 'Quit',
+    }
+    BACKGROUND = '#006600'
 
-class View:
-    """This class represents the view of the game, controlling the visual aspects of each stage of the game."""
-    def __init__(self, model=Model(), display='menu') -> None:
+    def __init__(self, model=None, display='menu', hint=False) -> None:
         """Constructs a view for a given display input given
         Params:
-            model (_type_): the model the view is constructed from.
+            model (_type_): the model the view is constructed from. Defaults to a new Model().
             display (str): selects the specific view needed for a certain stage in the game.
-            card_image_dict (dict): maps each card to respective image path - [0] gets image for 'card back'
-            window (layout): initial window layout for the game, used to get events and values from the view
+            hint (bool): shows the best play or fold decision on the bet screen. Defaults to False.
+            images (CardImages): in-memory image data the window is drawn from
+            preloaded (bool): whether every image has been read, done on the first display past the menu
+            window (sg.Window): the game's window, built on the first display, used to get events and values from the view
         """
-        self.model = model
-        self.curr_display = display
-        self.window = [
-            [sg.Text('Welcome to Three Card Poker!', justification='center', font=('Cooper Black', 50), size=(60, 1))],
-            [sg.Frame(
-                layout=[[sg.Button('Start', bind_return_key=True, size=(15, 1)),
-                         sg.Button('Quit', size=(15, 1))]],
-                title='',
-                border_width=0
-            )]
-        ] 
-        self.card_image_dict = {card.__hash__(): ('resources/cards/' + str(card.card_value) + str(card.card_suit.name[0]) + '.png') for card in self.model.deck.cards}
-        self.card_image_dict[0] = 'resources/cards/card_back.png'
+        super().__init__(model=model, display=display, hint=hint)
+        self.window = None
+        self.images = CardImages()
+        self.preloaded = False
         
         
+    def table_images(self):
+        """Gets the image of every card on the table, user's hand first, using the card
+        back for cards in a face down hand.
+        Returns:
+            list: PNG data in the order the cards are displayed.
+        """
+        images = self.images
+        return [images.card(card) if player.face_up else images.back()
+                for player in (self.model.user, self.model.dealer) for card in player.hand]
+
+    def build_window(self):
+        """Builds the window once with a hidden column for every stage.
+        Returns:
+            sg.Window: the game's window.
+        """
+        import PySimpleGUI as sg
+
+        def buttons(*buttons):
+            return sg.Frame(layout=[list(buttons)], title='', border_width=0)
+
+        def cards(prefix):
+            return [sg.Image(key=f'{prefix}-Card{i}') for i in range(6)]
+
+        def title(key, font_size):
+            return [sg.Text('', key=key, justification='center', font=('Cooper Black', font_size), size=(60, 1))]
+
+        def error(key):
+            return [sg.Text('', key=key, justification='center', font=('Cooper Black', 15), text_color='yellow', size=(60, 1))]
+
+        stages = {
+            'menu': [
+                title('Menu-Title', 50),
+                [buttons(sg.Button('Start', key='Menu-Start', bind_return_key=True, size=(15, 1)),
+                         sg.Button('Quit', key='Menu-Quit', size=(15, 1)))],
+            ],
+            'prebet': [
+                title('PreBet-Title', 25),
+                [sg.Frame(
+                    layout=[[sg.Slider(range=(0, 1), orientation='h', relief='flat',
+                                       border_width=0, background_color='White', size=(50, 15), key='PreBet-Slider')],
+                             [sg.Button('Bet', key='PreBet-Bet', size=(15, 1))]],
+                    title='',
+                    border_width=0
+                )],
+                error('PreBet-Error'),
+            ],
+            'bet': [
+                title('Bet-Title', 25),
+                cards('Bet'),
+                [sg.Text('', key='Bet-Hint', justification='center', font=('Cooper Black', 15), size=(60, 1))],
+                [sg.Frame(
+                    layout=[[sg.Slider(range=(0, 1), orientation='h', relief='flat',
+                                       border_width=0, background_color='White', size=(50, 15), key='Bet-Slider')],
+                             [sg.Button('Bet', key='Bet-Bet', size=(15, 1))],
+                             [sg.Button('Fold', key='Bet-Fold', size=(15, 1))]],
+                    title='',
+                    border_width=0
+                )],
+                error('Bet-Error'),
+            ],
+            'postbet': [
+                title('PostBet-Title', 25),
+                cards('PostBet'),
+                [sg.Frame(
+                    layout=[[sg.Button('Next Round', key='PostBet-Next', size=(15, 1))],
+                            [sg.Button('Quit', key='PostBet-Quit', size=(15, 1))]],
+                    title='',
+                    border_width=0
+                )],
+            ],
+            'gameover': [
+                title('GameOver-Title', 50),
+                [buttons(sg.Button('Play Again', key='GameOver-Again', bind_return_key=True, size=(15, 1)),
+                         sg.Button('Quit', key='GameOver-Quit', size=(15, 1)))],
+            ],
+        }
+        layout = [[sg.Column(stage_layout, key=stage, visible=False, background_color=self.BACKGROUND)]
+                  for stage, stage_layout in stages.items()]
+        window = sg.Window('Three Card Poker', size=(1150, 840), background_color=self.BACKGROUND, layout=layout).Finalize()
+        self.curr_loc = window.CurrentLocation()
+        self.curr_size = window.Size
+        return window
+
+    def update_cards(self, prefix):
+        """Updates the card images of a stage in place."""
+        for i, image in enumerate(self.table_images()):
+            self.window[f'{prefix}-Card{i}'].update(data=image)
+
     def menu(self):
         """Updates view to the welcome screen of the game, called by the display function."""
         window_title = 'Welcome to Three Card Poker!'
-        layout = [
-            [sg.Text(window_title, justification='center', font=('Cooper Black', 50), size=(60, 1))],
-            [sg.Frame(
-                layout=[[sg.Button('Start', bind_return_key=True, size=(15, 1)),
-                         sg.Button('Quit', size=(15, 1))]],
-                title='',
-                border_width=0
-            )]
-        ] 
-        
-        window =sg.Window(window_title, size=(1150, 840), background_color='#006600', layout=layout).Finalize()
-        self.curr_loc = window.CurrentLocation()
-        self.curr_size = window.Size
-        self.window = window
+        self.window['Menu-Title'].update(value=window_title)
+        self.window.set_title(window_title)
     
     def preBet(self):
         """Updates view to the prebet stage of the game where the user bets on the pair
         plus, called by the display function."""    
-        msg = 'Pair Plus Bet (Bet on your hand)\t Money: $' + str(self.model.user.money) + '\t Pot: $' + str(self.model.get_pot()) + '\t Pair Plus: $' + str(self.model.pair_plus)
-        layout = [
-            [sg.Text(msg, justification='center', font=('Cooper Black', 25), size=(60, 1))],
-            [sg.Frame(
-                layout=[[sg.Slider(range=(0, self.model.user.money), orientation='h', relief='flat',
-                                   border_width=0, background_color='White', size=(50, 15), key='PreBet-Slider')],
-                         [sg.Button('Bet', size=(15, 1))]],
-                title='',
-                border_width=0
-            )]
-        ]
-        window =sg.Window(title=msg, size=(1150, 840), background_color='#006600', layout=layout).Finalize()
-        self.curr_loc = window.CurrentLocation()
-        self.curr_size = window.Size
-        self.window = window
+        msg = 'Pair Plus Bet (Bet on your hand)\t Money: ' + format_money(self.model.user.money) + '\t Pot: ' + format_money(self.model.get_pot()) + '\t Pair Plus: ' + format_money(self.model.pair_plus)
+        self.window['PreBet-Title'].update(value=msg)
+        # Sliders are in whole dollars
+        self.window['PreBet-Slider'].update(value=0, range=(0, self.max_bet() // CENTS))
+        self.window['PreBet-Error'].update(value='')
+        self.window.set_title(msg)
 
     def bet(self):   
         """Updates view to the betting stage of the game where the user bets on the play
         wager and can also fold, called by the display function.""" 
-        window_title = 'Place a Bet or Fold\t Money: $' + str(self.model.user.money) + '\t Pot: $' + str(self.model.get_pot()) + '\t Pair Plus: $' + str(self.model.pair_plus)
-        layout = [
-            [sg.Text(window_title, justification='center', font=('Cooper Black', 25), size=(60, 1))],
-            [sg.Image(self.card_image_dict[card.__hash__()]) for card in sum(self.model.get_cards_on_table(), ())],
-            [sg.Frame(
-                layout=[[sg.Slider(range=(10, self.model.user.money), orientation='h', relief='flat',
-                                   border_width=0, background_color='White', size=(50, 15), key='Bet-Slider')],
-                         [sg.Button('Bet', size=(15, 1))],
-                         [sg.Button('Fold', size=(15, 1))]],
-                title='',
-                border_width=0
-            )]
-        ] 
-        
-        window =sg.Window(window_title, size=(1150, 840), background_color='#006600', layout=layout).Finalize()
-        self.curr_loc = window.CurrentLocation()
-        self.curr_size = window.Size
-        self.window = window
+        window_title = 'Place a Bet or Fold\t Money: ' + format_money(self.model.user.money) + '\t Pot: ' + format_money(self.model.get_pot()) + '\t Pair Plus: ' + format_money(self.model.pair_plus)
+        self.window['Bet-Title'].update(value=window_title)
+        self.update_cards('Bet')
+        self.window['Bet-Hint'].update(value=self.hint_text() if self.hint else '')
+        self.window['Bet-Error'].update(value='')
+        self.window['Bet-Slider'].update(value=self.model.rules.min_bet // CENTS, range=(self.model.rules.min_bet // CENTS, self.max_bet() // CENTS))
+        self.window.set_title(window_title)
         
     def postBet(self): 
         """Updates view to the post bet stage of the game, where the winner determines
         the message given by the game where the user can either quit or go on the next round.
         Called by the display function."""
-        verb = ''
-        if self.model.winner is not None:
-            if self.model.winner:
-                verb = ' won '
-            else:
-                verb = ' lost '
-        else:
-            ValueError('No winner assigned')
-        
         self.model.dealer.reveal_hand()
-        v = 'You' + verb + ' $' + str(self.model.get_pot() + self.model.get_pair_plus())
-        
-        layout = [
-            [sg.Text(v, justification='center', font=('Cooper Black', 25), size=(60, 1))],
-            [sg.Image(self.card_image_dict[card.__hash__()]) for card in sum(self.model.get_cards_on_table(), ())],
-            [sg.Frame(
-                layout=[[sg.Button('Next Round', size=(15, 1))],
-                        [sg.Button('Quit', size=(15, 1))]],
-                title='',
-                border_width=0
-            )]
-        ]   
-        
-        window =sg.Window(title=v, size=(1150, 840), background_color='#006600', layout=layout).Finalize()
-        self.curr_loc = window.CurrentLocation()
-        self.curr_size = window.Size
-        self.window = window
+        net = self.model.net
+        verb = ' won ' if net > 0 else ' lost ' if net < 0 else ' pushed '
+        v = 'You' + verb + ' ' + format_money(abs(net))
+        self.window['PostBet-Title'].update(value=v)
+        self.update_cards('PostBet')
+        self.window.set_title(v)
         
+    def show_error(self, message):
+        """Shows why the last bet was refused under the sliders of the prebet or bet stage, until
+        the stage is displayed again.
+        Args:
+            message (str): error message.
+        """
+        super().show_error(message)
+        if self.window is not None and self.curr_display in ('prebet', 'bet'):
+            self.window[('PreBet' if self.curr_display == 'prebet' else 'Bet') + '-Error'].update(value=message)
+
     def gameOver(self):
         """Updates the view to the game over stage of the game where the user can either restart the game or quit.
         Called by the display function."""
         window_title = 'Game Over!'
-        layout = [
-            [sg.Text(window_title, justification='center', font=('Cooper Black', 50), size=(60, 1))],
-            [sg.Frame(
-                layout=[[sg.Button('Play Again', bind_return_key=True, size=(15, 1)),
-                         sg.Button('Quit', size=(15, 1))]],
-                title='',
-                border_width=0
-            )]
-        ]  
-        
-        window =sg.Window(window_title, size=(1150, 840), background_color='#006600', layout=layout).Finalize()
-        self.curr_loc = window.CurrentLocation()
-        self.curr_size = window.Size
-        self.window = window
+        self.window['GameOver-Title'].update(value=window_title)
+        self.window.set_title(window_title)
 
     def display(self):
-        """Changes the 'display' of the view, where the stage is called from specified functions to
-        return the window and layout for said stage
+        """Changes the 'display' of the view, where the stage's elements are updated in place by
+        the specified functions and its column is shown in the window
         Stages:
             'menu': menu(), Inital game layout (Event(s): 'Start', 'Quit', Value(s): None)
             'prebet': preBet(), pairplus layout (Event(s): 'Bet', Value(s): 'PreBet-Slider')
@@ -149,37 +189,52 @@ class View:
         Raises:
             NotImplementedError: in the case of an invalid display option given from the controller
         """
+        if self.curr_display not in self.STAGES:
+            raise NotImplementedError(self.curr_display + ' is not a valid display option')
+        if self.window is None:
+            self.window = self.build_window()
+        # The menu shows no cards, so the images are read once it is up, before the first deal
+        if not self.preloaded and self.curr_display != 'menu':
+            self.images.preload()
+            self.preloaded = True
+
         if self.curr_display == 'menu':
             self.menu()
-        else:
-            if self.window != sg.WIN_CLOSED:
-                self.window.close()
-            
-            if self.curr_display == 'prebet':
-                self.preBet()
-            elif self.curr_display == 'bet':
-                self.bet()
-            elif self.curr_display == 'postbet':
-                self.postBet()
-            elif self.curr_display == 'gameover':
-                self.gameOver()
-            else:
-                raise NotImplementedError(self.curr_display + ' is not a valid display option')
+        elif self.curr_display == 'prebet':
+            self.preBet()
+        elif self.curr_display == 'bet':
+            self.bet()
+        elif self.curr_display == 'postbet':
+            self.postBet()
+        elif self.curr_display == 'gameover':
+            self.gameOver()
+
+        for stage in self.STAGES:
+            self.window[stage].update(visible=stage == self.curr_display)
         
-    def get_events_values(self):
-        """Gets events and values from the window of the current display.
+    def get_events_values(self, timeout=None):
+        """Gets events and values from the window of the current display, blocking until the
+        user acts or the timeout passes.
+        Args:
+            timeout (int): milliseconds to wait before returning sg.TIMEOUT_KEY, None to block.
+            Defaults to None.
         Raises:
             ValueError: if the program attempts to read a window which was already
             closed
         Returns:
             events, values: values and events given by the window.
         """
-        if self.window != sg.WIN_CLOSED:
-            return self.window.Read()
-        else:
+        if self.window is None:
             raise ValueError('Tried to read closed window')
+        event, values = self.window.Read(timeout=timeout)
+        return self.EVENTS.get(event, event), values
     
     def refresh(self):
         """Refreshes current window."""
         self.window.refresh()
-    
+
+    def close(self):
+        """Closes the window."""
+        if self.window is not None:
+            self.window.close()
+            self.window = None